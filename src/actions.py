@@ -6,12 +6,15 @@ from marshmallow import fields as mf
 from marshmallow_enum import EnumField
 from marshmallow_oneofschema import OneOfSchema
 
-from typing import Iterable, List, Optional, Sequence, cast
+from typing import Any, Iterable, List, Optional, Sequence, cast
 
 from . import defs, geometry, inventory, scene
 
 
 class Action(abc.ABC):
+    # Class of the client-side animation playing this action. Assigned in `animations`.
+    ANIMATION_CLS: Any = None
+
     class Schema(marshmallow.Schema):
         pass
 
@@ -19,7 +22,7 @@ class Action(abc.ABC):
         pass
 
     def to_string(self) -> str:
-        return json.dumps(ActionSchema().dump(self))
+        return json.dumps(_ACTION_SCHEMA.dump(self))
 
 
 
@@ -230,7 +233,7 @@ _ACTIONS = cast(Sequence[defs.Serializable], (
 class ActionSchema(OneOfSchema):
     """A schema for any type of action."""
 
-    type_schemas = { cls.SERIALIZATION_NAME: cls.Schema for cls in _ACTIONS }
+    type_schemas = { cls.SERIALIZATION_NAME: cls.Schema() for cls in _ACTIONS }
     type_names = { cls: cls.SERIALIZATION_NAME for cls in _ACTIONS }
 
     def get_obj_type(self, obj):
@@ -241,6 +244,10 @@ class ActionSchema(OneOfSchema):
             raise Exception("Unknown object type: {}".format(obj.__class__.__name__))
 
 
+# Schemas are stateless, so a single instance is shared instead of being built for every action.
+_ACTION_SCHEMA = ActionSchema()
+
+
 def action_from_json_string(string: str) -> Optional[Action]:
     """
     Converts a JSON string into an action.
@@ -249,7 +256,7 @@ def action_from_json_string(string: str) -> Optional[Action]:
 
     try:
         data = json.loads(string)
-        res = ActionSchema().load(data)
+        res = _ACTION_SCHEMA.load(data)
         return res
     except Exception as e:
         print(f'Action deserialisation failure: {e} - ({string})')
@@ -1,6 +1,7 @@
 import abc, json, time
+import numpy
 
-from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, Type, TYPE_CHECKING
 
 from . import actions, animating, defs, geometry, inventory
 
@@ -15,20 +16,13 @@ class AnimationName:
 
 
 class Animation(abc.ABC):
-    def __init__(self, timeout):
+    __slots__ = ('_expired',)
+
+    def __init__(self) -> None:
         self._expired = False
-        self.start_time = time.monotonic()
-        self.timeout = timeout
 
     def expired(self) -> bool:
-        if self._expired:
-            return True
-
-        elif self.timeout is not None:
-            return self.start_time + self.timeout < time.monotonic()
-
-        else:
-            return False
+        return self._expired
 
     # If a newly added action returns an actor ID, it cancels and replaces any other action assigned
     # to the same actor.
@@ -43,9 +37,32 @@ class Animation(abc.ABC):
         raise NotImplementedError('This animation is not implemented')
 
 
-class ConfigurationAnimation(Animation):
+class _InstantAnimation(Animation):
+    """An animation expiring only when explicitly expired by itself."""
+
+    __slots__ = ()
+
+
+class _TimedAnimation(Animation):
+    """An animation expiring after the given timeout or when explicitly expired by itself."""
+
+    __slots__ = ('_deadline',)
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__()
+        self._deadline = time.monotonic() + timeout
+
+    # `time.monotonic` is bound as a default argument to avoid the global and attribute lookups on
+    # every call - this method is checked for every animation in every frame.
+    def expired(self, _monotonic=time.monotonic) -> bool:
+        return self._expired or self._deadline < _monotonic()
+
+
+class ConfigurationAnimation(_InstantAnimation):
+    __slots__ = ('hero_actor_id', 'elevation_function')
+
     def __init__(self, action: actions.ConfigurationAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.hero_actor_id = action.hero_actor_id
         self.elevation_function = action.elevation_function
 
@@ -54,27 +71,33 @@ class ConfigurationAnimation(Animation):
         self.expire()
 
 
-class CraftStartAnimation(Animation):
+class CraftStartAnimation(_InstantAnimation):
+    __slots__ = ('crafter_id',)
+
     def __init__(self, action: actions.CraftStartAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.crafter_id = action.crafter_id
 
     def tick(self, interval, context: animating.AnimationContext) -> None:
         self.expire()
 
 
-class CraftEndAnimation(Animation):
+class CraftEndAnimation(_InstantAnimation):
+    __slots__ = ('crafter_id',)
+
     def __init__(self, action: actions.CraftEndAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.crafter_id = action.crafter_id
 
     def tick(self, interval, context: animating.AnimationContext) -> None:
         self.expire()
 
 
-class CreateActorsAnimation(Animation):
+class CreateActorsAnimation(_InstantAnimation):
+    __slots__ = ('actors',)
+
     def __init__(self, action: actions.CreateActorsAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.actors = action.actors
 
     def tick(self, interval, context: animating.AnimationContext) -> None:
@@ -83,9 +106,11 @@ class CreateActorsAnimation(Animation):
         self.expire()
 
 
-class DeleteActorsAnimation(Animation):
+class DeleteActorsAnimation(_InstantAnimation):
+    __slots__ = ('actor_ids',)
+
     def __init__(self, action: actions.DeleteActorsAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.actor_ids = action.actor_ids
 
     def tick(self, interval, context: animating.AnimationContext) -> None:
@@ -94,13 +119,18 @@ class DeleteActorsAnimation(Animation):
         self.expire()
 
 
-class MovementAnimation(Animation):
+class MovementAnimation(_TimedAnimation):
+    __slots__ = ('actor_id', 'speed', 'bearing', '_walking')
+
+    # Below this number of moving actors the per-animation path is cheaper than the NumPy overhead.
+    BATCH_MIN_SIZE = 16
+
     def __init__(self, action: actions.MovementAction) -> None:
         super().__init__(action.duration)
         self.actor_id = action.actor_id
         self.speed = action.speed
         self.bearing = action.bearing
-        self._tick_count = 0
+        self._walking = False
 
     def get_actor_id(self) -> defs.ActorId:
         return self.actor_id
@@ -109,14 +139,54 @@ class MovementAnimation(Animation):
         distance = self.speed * interval
         actor = context.scene.get_actor(self.actor_id)
         actor.move_by(distance, self.bearing, context.scene.get_radius())
-        if self._tick_count == 0:
-            context.world.play_animation(self.actor_id, AnimationName.WALK)
-        self._tick_count += 1
+        self.start_walking(context)
 
+    def start_walking(self, context: animating.AnimationContext) -> None:
+        # The walk animation is started only once, on the first tick.
+        if not self._walking:
+            context.world.play_animation(self.actor_id, AnimationName.WALK)
+            self._walking = True
+
+    @staticmethod
+    def tick_many(
+            movements: List['MovementAnimation'],
+            interval,
+            context: animating.AnimationContext,
+        ) -> None:
+        """Ticks all the passed movement animations moving their actors in one vectorized pass."""
+
+        if len(movements) < MovementAnimation.BATCH_MIN_SIZE:
+            for movement in movements:
+                movement.tick(interval, context)
+            return
+
+        actors = [context.scene.get_actor(movement.actor_id) for movement in movements]
+        moving = [
+                (movement, actor, actor.position)
+                for movement, actor in zip(movements, actors)
+                if actor.position is not None
+            ]
+
+        thetas, phis = geometry.Points.moved_by(
+            numpy.fromiter((position.theta for _, _, position in moving), float, len(moving)),
+            numpy.fromiter((position.phi for _, _, position in moving), float, len(moving)),
+            interval * numpy.fromiter((m.speed for m, _, _ in moving), float, len(moving)),
+            numpy.fromiter((m.bearing for m, _, _ in moving), float, len(moving)),
+            context.scene.get_radius(),
+        )
+
+        for (_, actor, _), theta, phi in zip(moving, thetas.tolist(), phis.tolist()):
+            actor.set_position(geometry.Point(theta, phi))
+
+        for movement in movements:
+            movement.start_walking(context)
+
+
+class LocalizeAnimation(_InstantAnimation):
+    __slots__ = ('actor_id', 'position')
 
-class LocalizeAnimation(Animation):
     def __init__(self, action: actions.LocalizeAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.actor_id = action.actor_id
         self.position = action.position
 
@@ -124,16 +194,16 @@ class LocalizeAnimation(Animation):
         return self.actor_id
 
     def tick(self, interval, context: animating.AnimationContext) -> None:
-        actor = context.scene.get_actor(self.actor_id)
-        if actor is not None:
-            actor.set_position(self.position)
+        context.scene.get_actor(self.actor_id).set_position(self.position)
         context.world.play_animation(self.actor_id, AnimationName.IDLE)
         self.expire()
 
 
-class StatUpdateAnimation(Animation):
+class StatUpdateAnimation(_InstantAnimation):
+    __slots__ = ('actor_id', 'stats')
+
     def __init__(self, action: actions.StatUpdateAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.actor_id = action.actor_id
         self.stats = action.stats
 
@@ -142,9 +212,11 @@ class StatUpdateAnimation(Animation):
         self.expire()
 
 
-class PickStartAnimation(Animation):
+class PickStartAnimation(_InstantAnimation):
+    __slots__ = ('actor_id', 'item_id')
+
     def __init__(self, action: actions.PickStartAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.actor_id = action.who
         self.item_id = action.what
 
@@ -153,9 +225,11 @@ class PickStartAnimation(Animation):
         self.expire()
 
 
-class PickEndAnimation(Animation):
+class PickEndAnimation(_InstantAnimation):
+    __slots__ = ('actor_id',)
+
     def __init__(self, action: actions.PickEndAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.actor_id = action.who
 
     def tick(self, interval, context: animating.AnimationContext) -> None:
@@ -163,9 +237,11 @@ class PickEndAnimation(Animation):
         self.expire()
 
 
-class UpdateInventoryAnimation(Animation):
+class UpdateInventoryAnimation(_InstantAnimation):
+    __slots__ = ('owner_id', 'inventory')
+
     def __init__(self, action: actions.UpdateInventoryAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.owner_id = action.owner_id
         self.inventory = action.inventory
 
@@ -183,9 +259,11 @@ class UpdateInventoryAnimation(Animation):
         self.expire()
 
 
-class DamageAnimation(Animation):
+class DamageAnimation(_InstantAnimation):
+    __slots__ = ('dealer_id', 'receiver_id', 'variant', 'hand')
+
     def __init__(self, action: actions.DamageAction) -> None:
-        super().__init__(None)
+        super().__init__()
         self.dealer_id = action.dealer_id
         self.receiver_id = action.receiver_id
         self.variant = action.variant
@@ -206,7 +284,7 @@ class DamageAnimation(Animation):
         self.expire()
 
 
-_ANIMATION_CONSTRUCTORS: Dict[type, Any] = {
+_ANIMATION_CONSTRUCTORS: Dict[Type[actions.Action], Any] = {
         actions.ConfigurationAction: ConfigurationAnimation,
         actions.CraftStartAction: CraftStartAnimation,
         actions.CraftEndAction: CraftEndAnimation,
@@ -221,9 +299,12 @@ _ANIMATION_CONSTRUCTORS: Dict[type, Any] = {
         actions.DamageAction: DamageAnimation,
     }
 
+for action_cls, animation_cls in _ANIMATION_CONSTRUCTORS.items():
+    action_cls.ANIMATION_CLS = animation_cls
+
 
 def animation_from_action(action: actions.Action) -> Optional[Animation]:
     """Converts an `Action` into an `Animation`."""
 
-    return _ANIMATION_CONSTRUCTORS[type(action)](action)
+    return action.ANIMATION_CLS(action)
 
@@ -29,8 +29,14 @@ class Animator:
         for animation in self.general_animations:
             animation.tick(tick_interval, self.context)
 
+        movements: List[animations.MovementAnimation] = list()
         for animation in self.actor_animations.values():
-            animation.tick(tick_interval, self.context)
+            if isinstance(animation, animations.MovementAnimation):
+                movements.append(animation)
+            else:
+                animation.tick(tick_interval, self.context)
+
+        animations.MovementAnimation.tick_many(movements, tick_interval, self.context)
 
         self.prev_tick = now
 
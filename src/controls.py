@@ -1,11 +1,10 @@
 import pyglet
-import time
 
 from math import pi
 
 from pyglet.window import key
 
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from . import defs, gui, proxy, world
 
@@ -13,34 +12,60 @@ from . import defs, gui, proxy, world
 PlainCallbackDict = Dict[Tuple[int, int], Callable[[], None]]
 IntervalCallbackDict = Dict[Tuple[int, int], Callable[[float], None]]
 
+_HALF_PI = 0.5 * pi
+_NEG_HALF_PI = -0.5 * pi
+_TILT_STEP = 0.1 * pi
+_NEG_TILT_STEP = -0.1 * pi
+_MODIFIER_KEYS = frozenset((key.LCTRL, key.RCTRL, key.LSHIFT, key.RSHIFT))
+
+
+class _RepeatableActions:
+    """Actions performed on every frame while the corresponding key is held.
+
+    Implemented as bound methods rather than lambdas so that the per-frame calls do not go through
+    closure cells. The scaling constants are precomputed at module level.
+    """
+
+    def __init__(self, world: world.World) -> None:
+        self.world = world
+
+    def rotate_right(self, interval: float) -> None:
+        self.world.rotate_by(_HALF_PI * interval)
+
+    def rotate_left(self, interval: float) -> None:
+        self.world.rotate_by(_NEG_HALF_PI * interval)
+
 
 class Controls:
     MOD_MASK = key.MOD_CTRL | key.MOD_SHIFT
+    TICK_INTERVAL = 1.0 / 120.0 # sec
+    MOTION_RESEND_INTERVAL = 1.0 / 30.0 # sec
 
     def __init__(self, world: world.World, gui: gui.Gui, proxy: proxy.Proxy) -> None:
         NOMODS = 0x0
         CTRL = key.MOD_CTRL
         SHIFT = key.MOD_SHIFT
-        self.prev_moment: Optional[float] = None
+        self._ticking = False
+        self._since_motion_sent = 0.0
         self.current_symbol_pressed = None
         self.current_action: Optional[Callable[[], None]] = None
 
         self.persistent_actions: PlainCallbackDict = {
-                (key.A, NOMODS): lambda: proxy.send_motion(world.get_bearing() - 0.5 * pi),
-                (key.D, NOMODS): lambda: proxy.send_motion(world.get_bearing() + 0.5 * pi),
-                (key.S, NOMODS): lambda: proxy.send_motion(world.get_bearing() + 1.0 * pi),
-                (key.W, NOMODS): lambda: proxy.send_motion(world.get_bearing() + 0.0 * pi),
+                (key.A, NOMODS): lambda: proxy.send_motion(world.get_bearing() + _NEG_HALF_PI),
+                (key.D, NOMODS): lambda: proxy.send_motion(world.get_bearing() + _HALF_PI),
+                (key.S, NOMODS): lambda: proxy.send_motion(world.get_bearing() + pi),
+                (key.W, NOMODS): lambda: proxy.send_motion(world.get_bearing()),
                 (key.Z, NOMODS): lambda: proxy.send_hand_activation(defs.Hand.LEFT, None),
                 (key.X, NOMODS): lambda: proxy.send_hand_activation(defs.Hand.RIGHT, None),
-                (key.LEFT,  NOMODS): lambda: proxy.send_motion(world.get_bearing() - 0.5 * pi),
-                (key.RIGHT, NOMODS): lambda: proxy.send_motion(world.get_bearing() + 0.5 * pi),
-                (key.DOWN,  NOMODS): lambda: proxy.send_motion(world.get_bearing() + 1.0 * pi),
-                (key.UP,    NOMODS): lambda: proxy.send_motion(world.get_bearing() + 0.0 * pi),
+                (key.LEFT,  NOMODS): lambda: proxy.send_motion(world.get_bearing() + _NEG_HALF_PI),
+                (key.RIGHT, NOMODS): lambda: proxy.send_motion(world.get_bearing() + _HALF_PI),
+                (key.DOWN,  NOMODS): lambda: proxy.send_motion(world.get_bearing() + pi),
+                (key.UP,    NOMODS): lambda: proxy.send_motion(world.get_bearing()),
             }
 
         self.single_actions: PlainCallbackDict = {
-                (key.BRACKETLEFT, NOMODS): lambda: world.tilt_by(-0.1 * pi),
-                (key.BRACKETRIGHT, NOMODS): lambda: world.tilt_by(0.1 * pi),
+                (key.BRACKETLEFT, NOMODS): lambda: world.tilt_by(_NEG_TILT_STEP),
+                (key.BRACKETRIGHT, NOMODS): lambda: world.tilt_by(_TILT_STEP),
                 (key.PLUS, NOMODS): lambda: world.zoom_by(5),
                 (key.NUM_ADD, NOMODS): lambda: world.zoom_by(5),
                 (key.MINUS, NOMODS): lambda: world.zoom_by(-5),
@@ -79,18 +104,24 @@ class Controls:
                 (key.UP,    NOMODS): lambda: proxy.send_stop(),
             }
 
+        self._repeatables = _RepeatableActions(world)
         self.repeatable_actions: IntervalCallbackDict = {
-                (key.E, NOMODS): lambda intv: world.rotate_by(0.5 * pi * intv),
-                (key.Q, NOMODS): lambda intv: world.rotate_by(-0.5 * pi * intv),
+                (key.E, NOMODS): self._repeatables.rotate_right,
+                (key.Q, NOMODS): self._repeatables.rotate_left,
             }
 
-        self.active_actions: IntervalCallbackDict = {}
+        # Repeatable actions are driven by the key state instead of press and release bookkeeping.
+        # The key state is reset when the window loses focus, so no key can get stuck.
+        self.key_state = key.KeyStateHandler()
+        self._repeatable_keys: List[Tuple[int, int, Callable[[float], None]]] = [
+                (symbol, modifiers, action)
+                for (symbol, modifiers), action in self.repeatable_actions.items()
+            ]
 
         self.world = world
         self.proxy = proxy
 
     def handle_key_press(self, symbol, modifiers) -> None:
-        self.prev_moment = time.monotonic()
         key = (symbol, Controls.MOD_MASK & modifiers)
 
         if (action1 := self.single_actions.get(key, None)) is not None:
@@ -101,9 +132,10 @@ class Controls:
             action1()
             self.current_symbol_pressed = symbol
             self.current_action = action1
+            self._since_motion_sent = 0.0
 
-        elif (action2 := self.repeatable_actions.get(key, None)) is not None:
-            self.active_actions[key] = action2
+        elif key in self.repeatable_actions:
+            self._start_ticking()
 
     def handle_key_release(self, symbol, modifiers) -> None:
         key = (symbol, Controls.MOD_MASK & modifiers)
@@ -115,24 +147,50 @@ class Controls:
                 self.current_symbol_pressed = None
                 self.current_action = None
 
-        elif key in self.repeatable_actions:
-            del self.active_actions[key]
-
-    def handle_draw(self) -> bool:
-        current_moment = time.monotonic()
-        if self.prev_moment is not None:
-            interval = current_moment - self.prev_moment
-            if interval > 0:
-                for key, action in self.active_actions.items():
-                    action(interval)
-                if self.current_action is not None:
+        elif symbol in _MODIFIER_KEYS:
+            # A repeatable key held while a modifier is released becomes active again
+            self._start_ticking()
+
+    def _start_ticking(self) -> None:
+        if not self._ticking:
+            pyglet.clock.schedule_interval(self._tick, self.TICK_INTERVAL)
+            self._ticking = True
+
+    def _tick(self, interval: float) -> None:
+        key_state = self.key_state
+        modifiers = self._get_modifiers()
+
+        active = False
+        for symbol, action_modifiers, action in self._repeatable_keys:
+            if key_state[symbol] and modifiers == action_modifiers:
+                action(interval)
+                active = True
+
+        # Repeatable actions may change the bearing, so the current motion has to be resent. This is
+        # throttled to keep the network traffic independent of the tick rate. A change not sent yet
+        # is sent when ticking stops.
+        if self.current_action is not None:
+            if active:
+                self._since_motion_sent += interval
+                if self.MOTION_RESEND_INTERVAL <= self._since_motion_sent:
                     self.current_action()
-
-        active = len(self.active_actions) > 0
-        if active:
-            self.prev_moment = current_moment
-        else:
-            self.prev_moment = None
-
-        return active
-
+                    self._since_motion_sent = 0.0
+            elif 0.0 < self._since_motion_sent:
+                self.current_action()
+                self._since_motion_sent = 0.0
+
+        # Stop ticking until the next press of a repeatable key so that idle frames cost nothing.
+        if not active:
+            pyglet.clock.unschedule(self._tick)
+            self._ticking = False
+
+    def _get_modifiers(self) -> int:
+        """Returns the currently held modifiers masked the same way as in key press handling."""
+
+        key_state = self.key_state
+        modifiers = 0x0
+        if key_state[key.LCTRL] or key_state[key.RCTRL]:
+            modifiers |= key.MOD_CTRL
+        if key_state[key.LSHIFT] or key_state[key.RSHIFT]:
+            modifiers |= key.MOD_SHIFT
+        return modifiers
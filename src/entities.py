@@ -2,15 +2,31 @@ import random
 
 from math import pi
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
 
 from . import actions, craft, defs, essentials, events, features, settings, tasks
 
 
+# `IdleTask` holds no per-entity state, so a single instance is shared by all entities.
+_IDLE_TASK = essentials.IdleTask()
+
+EntityType = TypeVar('EntityType', bound=Type[essentials.Entity])
+
+
+def register_entity(klass: EntityType) -> EntityType:
+    """Registers the decorated entity class so it can be constructed by its codename."""
+
+    settings.ENTITIES[klass.CODENAME] = klass
+    return klass
+
+
+@register_entity
 class Rocks(essentials.Entity):
     CODENAME = 'rocks'
     ESSENCE = craft.Essence.ROCKS
 
+    __slots__ = ()
+
     def __init__(self, id: defs.ActorId, position: essentials.EntityPosition) -> None:
         super().__init__(id, position)
         self.features.set_inventorable(settings.Sizes.SMALL.value)
@@ -20,10 +36,13 @@ class Rocks(essentials.Entity):
         pass
 
 
+@register_entity
 class Gold(essentials.Entity):
     CODENAME = 'gold'
     ESSENCE = craft.Essence.GOLD
 
+    __slots__ = ()
+
     def __init__(self, id: defs.ActorId, position: essentials.EntityPosition) -> None:
         super().__init__(id, position)
         self.features.set_inventorable(settings.Sizes.SMALL.value)
@@ -37,6 +56,8 @@ class RawMeat(essentials.Entity):
     CODENAME = 'raw_meat'
     ESSENCE = craft.Essence.MEAT
 
+    __slots__ = ()
+
     def __init__(self, id: defs.ActorId, position: essentials.EntityPosition) -> None:
         super().__init__(id, position)
         self.features.set_inventorable(settings.Sizes.SMALL.value)
@@ -46,10 +67,13 @@ class RawMeat(essentials.Entity):
         pass
 
 
+@register_entity
 class Log(essentials.Entity):
     CODENAME = 'log'
     ESSENCE = craft.Essence.LOGS
 
+    __slots__ = ()
+
     def __init__(self, id: defs.ActorId, position: essentials.EntityPosition) -> None:
         super().__init__(id, position)
         self.features.set_inventorable(settings.Sizes.HUGE.value)
@@ -58,10 +82,13 @@ class Log(essentials.Entity):
         pass
 
 
+@register_entity
 class Axe(essentials.Entity):
     CODENAME = 'axe'
     ESSENCE = craft.Essence.TOOL
 
+    __slots__ = ()
+
     def __init__(self, id: defs.ActorId, position: essentials.EntityPosition) -> None:
         super().__init__(id, position)
         self.features.set_inventorable(settings.Sizes.MEDIUM.value)
@@ -76,10 +103,13 @@ class Axe(essentials.Entity):
         pass
 
 
+@register_entity
 class Spruce(essentials.Entity):
     CODENAME = 'spruce'
     ESSENCE = craft.Essence.PLANT
 
+    __slots__ = ()
+
     def __init__(self, id: defs.ActorId, position: essentials.EntityPosition) -> None:
         super().__init__(id, position)
         self.features.set_damageable(
@@ -96,14 +126,22 @@ class Spruce(essentials.Entity):
                 self.task = tasks.DieAndDropTask(self.get_id(), self.generate_drops())
 
     def generate_drops(self) -> List[essentials.Entity]:
-        assert self.position is not None
-        return [Log(defs.UNASSIGNED_ACTOR_ID, self.position) for i in range(3)]
+        position = self.position
+        assert position is not None
+        return [
+            Log(defs.UNASSIGNED_ACTOR_ID, position),
+            Log(defs.UNASSIGNED_ACTOR_ID, position),
+            Log(defs.UNASSIGNED_ACTOR_ID, position),
+        ]
 
 
+@register_entity
 class Warrior(essentials.Entity):
     CODENAME = 'warrior'
     ESSENCE = craft.Essence.HERO
 
+    __slots__ = ()
+
     def __init__(self, id: defs.ActorId, position: essentials.EntityPosition) -> None:
         super().__init__(id, position)
         self.features.set_performer()
@@ -114,28 +152,48 @@ class Warrior(essentials.Entity):
             )
 
     def handle_event(self, event: events.Event) -> None:
-        if isinstance(event, events.ResumeEvent) or isinstance(event, events.FinishedEvent):
-            bearing = random.uniform(-pi, pi)
-            self.task = tasks.WalkTask(self.get_id(), speed=1.0, bearing=bearing, duration=1.0)
-
-        elif isinstance(event, events.DamageEvent):
-            assert self.features.damageable
-            is_alive = self.features.damageable.handle_damage(event.damage_amount)
-            if is_alive:
-                pass # TODO: Attack the attacker back.
-
-            else:
-                self.task = tasks.DieAndDropTask(self.get_id(), self.generate_drops())
+        handler = self._EVENT_HANDLERS.get(type(event), None)
+        if handler is not None:
+            handler(self, event)
+
+    def _on_idle(self, event: events.Event) -> None:
+        bearing = random.uniform(-pi, pi)
+        self.task = tasks.WalkTask(self.get_id(), speed=1.0, bearing=bearing, duration=1.0)
+
+    def _on_damage(self, event: events.DamageEvent) -> None:
+        assert self.features.damageable
+        is_alive = self.features.damageable.handle_damage(event.damage_amount)
+        if is_alive:
+            pass # TODO: Attack the attacker back.
+
+        else:
+            self.task = tasks.DieAndDropTask(self.get_id(), self.generate_drops())
+
+    # Handlers are looked up by the exact event type instead of a chain of `isinstance` checks.
+    _EVENT_HANDLERS: Dict[type, Callable[..., None]] = {
+            events.ResumeEvent: _on_idle,
+            events.FinishedEvent: _on_idle,
+            events.DamageEvent: _on_damage,
+        }
 
     def generate_drops(self) -> List[essentials.Entity]:
-        assert self.position is not None
-        return [RawMeat(defs.UNASSIGNED_ACTOR_ID, self.position) for i in range(4)]
+        position = self.position
+        assert position is not None
+        return [
+            RawMeat(defs.UNASSIGNED_ACTOR_ID, position),
+            RawMeat(defs.UNASSIGNED_ACTOR_ID, position),
+            RawMeat(defs.UNASSIGNED_ACTOR_ID, position),
+            RawMeat(defs.UNASSIGNED_ACTOR_ID, position),
+        ]
 
 
+@register_entity
 class Pirate(essentials.Entity):
     CODENAME = 'pirate'
     ESSENCE = craft.Essence.HERO
 
+    __slots__ = ()
+
     def __init__(self, id: defs.ActorId, position: essentials.EntityPosition) -> None:
         self.task: essentials.Task
         super().__init__(id, position)
@@ -143,39 +201,45 @@ class Pirate(essentials.Entity):
         self.features.set_eater(max_capacity=100.0, hunger_value=50.0)
 
     def handle_event(self, event: events.Event) -> None:
-        assert self.features.inventory
+        handler = self._EVENT_HANDLERS.get(type(event), None)
+        if handler is not None:
+            handler(self, event)
 
-        if isinstance(event, events.ConcludeEvent):
-            self.task.conclude()
+    def _on_conclude(self, event: events.ConcludeEvent) -> None:
+        self.task.conclude()
 
-        elif isinstance(event, events.StopEvent) or isinstance(event, events.FinishedEvent):
-            self.task = essentials.IdleTask()
+    def _on_stop(self, event: events.Event) -> None:
+        self.task = _IDLE_TASK
 
-        elif isinstance(event, events.StartMotionEvent):
-            self.task = tasks.MovementTask(self.get_id(), speed=1.0, bearing=event.bearing)
-
-        elif isinstance(event, events.HandActivationEvent):
-            item_id = self.features.inventory.get().get_hand(event.hand)
-            if item_id is not None:
-                self.task = tasks.UseItemTask(self.get_id(), item_id, event.object_id, event.hand)
-            else:
-                self.task = tasks.PickItemTask(self.get_id(), event.object_id, event.hand)
-
-        elif isinstance(event, events.InventoryUpdateEvent):
-            self.task = tasks.InventoryUpdateTask(
-                self.get_id(),
-                event.hand,
-                event.inventory_index,
-                event.update_variant,
-            )
-
-        elif isinstance(event, events.CraftEvent):
-            self.task = tasks.CraftTask(self.get_id(), event.assembly)
-
-        elif isinstance(event, events.ResumeEvent):
-            self.task = essentials.IdleTask()
-
-
-for klass in [Rocks, Gold, Log, Axe, Spruce, Warrior, Pirate]:
-    settings.ENTITIES[klass.CODENAME] = klass
+    def _on_start_motion(self, event: events.StartMotionEvent) -> None:
+        self.task = tasks.MovementTask(self.get_id(), speed=1.0, bearing=event.bearing)
 
+    def _on_hand_activation(self, event: events.HandActivationEvent) -> None:
+        assert self.features.inventory
+        item_id = self.features.inventory.get().get_hand(event.hand)
+        if item_id is not None:
+            self.task = tasks.UseItemTask(self.get_id(), item_id, event.object_id, event.hand)
+        else:
+            self.task = tasks.PickItemTask(self.get_id(), event.object_id, event.hand)
+
+    def _on_inventory_update(self, event: events.InventoryUpdateEvent) -> None:
+        self.task = tasks.InventoryUpdateTask(
+            self.get_id(),
+            event.hand,
+            event.inventory_index,
+            event.update_variant,
+        )
+
+    def _on_craft(self, event: events.CraftEvent) -> None:
+        self.task = tasks.CraftTask(self.get_id(), event.assembly)
+
+    _EVENT_HANDLERS: Dict[type, Callable[..., None]] = {
+            events.ConcludeEvent: _on_conclude,
+            events.StopEvent: _on_stop,
+            events.FinishedEvent: _on_stop,
+            events.StartMotionEvent: _on_start_motion,
+            events.HandActivationEvent: _on_hand_activation,
+            events.InventoryUpdateEvent: _on_inventory_update,
+            events.CraftEvent: _on_craft,
+            events.ResumeEvent: _on_stop,
+        }
@@ -95,6 +95,8 @@ class Entity:
     CODENAME = '<void>'
     ESSENCE = craft.Essence.VOID
 
+    __slots__ = ('id', 'task', 'features', 'position')
+
     def __init__(self, id: defs.ActorId, position: EntityPosition) -> None:
         self.id = id
         self.task: Task = IdleTask()
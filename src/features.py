@@ -9,6 +9,8 @@ from . import craft, defs, inventory
 
 
 class Feature:
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -17,6 +19,8 @@ class Feature:
 
 
 class PerformerFeature(Feature):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -25,11 +29,15 @@ class PerformerFeature(Feature):
 
 
 class EdibleFeature(Feature):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class EaterFeature(Feature):
+    __slots__ = ('max_capacity', 'hunger_value')
+
     def __init__(self, max_capacity: float, hunger_value: float) -> None:
         super().__init__()
         self.max_capacity = max_capacity
@@ -46,6 +54,8 @@ class EaterFeature(Feature):
 
 
 class ToolOrWeaponFeature(Feature):
+    __slots__ = ('damage',)
+
     def __init__(
             self,
             hit_damage: float,
@@ -66,6 +76,8 @@ class ToolOrWeaponFeature(Feature):
 
 
 class DamageableFeature(Feature):
+    __slots__ = ('health', 'max_health', 'damage_variant')
+
     def __init__(
             self,
             start_health: float,
@@ -86,6 +98,8 @@ class DamageableFeature(Feature):
 
 
 class InventoryFeature(Feature):
+    __slots__ = ('inventory',)
+
     def __init__(self) -> None:
         super().__init__()
         self.inventory = inventory.Inventory()
@@ -112,6 +126,8 @@ class InventoryFeature(Feature):
 
 
 class InventorableFeature(Feature):
+    __slots__ = ('volume', 'stored_by')
+
     def __init__(self, volume: int) -> None:
         super().__init__()
         self.volume = volume
@@ -125,6 +141,8 @@ class InventorableFeature(Feature):
 
 
 class StackableFeature(Feature):
+    __slots__ = ('stack_size',)
+
     def __init__(self, stack_size: int) -> None:
         super().__init__()
         self.stack_size = stack_size
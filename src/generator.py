@@ -1,10 +1,21 @@
-import math, random
+import math
+import numpy
 
 from typing import List
 
 from . import entities, essentials, geometry, state
 
 
+def _sample_spruce_positions(n: int) -> numpy.ndarray:
+    """Returns `n` random `(phi, theta)` pairs for spruce placement as an `n` by 2 array."""
+
+    return numpy.random.uniform(
+            low=(0.45 * math.pi, -0.05 * math.pi),
+            high=(0.55 * math.pi, 0.05 * math.pi),
+            size=(n, 2),
+        )
+
+
 class WorldGenerator:
     def generate_basic(self, radius) -> state.State:
         elevation_function = geometry.ElevationFunction(radius)
@@ -28,10 +39,11 @@ class WorldGenerator:
             entities.Gold(6, (0.496 * math.pi, 0.004 * math.pi)),
         ]
 
-        for i in range(7, 100):
-            phi = random.uniform(0.45 * math.pi, 0.55 * math.pi)
-            theta = random.uniform(-0.05 * math.pi, 0.05 * math.pi)
-            entity_list.append(entities.Spruce(i, (phi, theta)))
+        # Convert to plain floats at once rather than unpacking a row view per spruce.
+        positions = _sample_spruce_positions(100 - 7).tolist()
+        entity_list += [
+            entities.Spruce(i, (phi, theta)) for i, (phi, theta) in enumerate(positions, start=7)
+        ]
 
         return state.State(elevation_function, entity_list)
 
@@ -1,21 +1,41 @@
 import abc, enum
 from dataclasses import dataclass
-from math import asin, atan2, cos, degrees, pi, radians, sin, sqrt, tan
+from math import acos, asin, atan2, cos, hypot, pi, remainder, sin, sqrt, tan
 
 import marshmallow, numpy
 from marshmallow import fields as mf
 from marshmallow_oneofschema import OneOfSchema
 
-from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple, cast
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union, cast
 
 ####################################################################################################
 
+_DEGREES_PER_RADIAN = 180.0 / pi
+_RADIANS_PER_DEGREE = pi / 180.0
+
+
+def _any_array(*values) -> bool:
+    return any(isinstance(value, numpy.ndarray) for value in values)
+
+
 class Coordinates:
+    """Conversions between coordinate systems.
+
+    All the functions accept either scalars or NumPy arrays of coordinates. Scalars are converted
+    with `math` functions, which are much cheaper than NumPy for single values.
+    """
+
     @staticmethod
     def cartesian_to_spherical(x, y, z):
-        r = sqrt(x * x + y * y + z * z)
-        theta = atan2(sqrt(x * x + z * z), y) if y != 0.0 else 0.5 * pi
-        phi = atan2(x, z) if z != 0.0 else 0.5 * pi
+        if _any_array(x, y, z):
+            r = numpy.sqrt(x * x + y * y + z * z)
+            theta = numpy.arctan2(numpy.hypot(x, z), y)
+            phi = numpy.where((x != 0.0) | (z != 0.0), numpy.arctan2(x, z), 0.5 * pi)
+            return r, theta, phi
+
+        r = hypot(x, y, z)
+        theta = atan2(hypot(x, z), y)
+        phi = atan2(x, z) if x != 0.0 or z != 0.0 else 0.5 * pi
         return r, theta, phi
 
     @staticmethod
@@ -30,6 +50,10 @@ class Coordinates:
 
     @staticmethod
     def spherical_to_cartesian(r, theta, phi):
+        if _any_array(r, theta, phi):
+            r_sin_theta = r * numpy.sin(theta)
+            return r_sin_theta * numpy.sin(phi), r * numpy.cos(theta), r_sin_theta * numpy.cos(phi)
+
         z = r * sin(theta) * cos(phi)
         x = r * sin(theta) * sin(phi)
         y = r * cos(theta)
@@ -38,46 +62,84 @@ class Coordinates:
     @staticmethod
     def spherical_to_geographical_radians(r, theta, phi):
         lat = 0.5 * pi - theta
-        lon = phi if phi <= pi else phi - 2.0 * pi
+        if _any_array(phi):
+            # Equivalent of `remainder`: rounding half to even maps the result to [-pi, pi].
+            lon = phi - 2.0 * pi * numpy.round(phi / (2.0 * pi))
+        else:
+            lon = remainder(phi, 2.0 * pi)
         return r, lat, lon
 
     @staticmethod
     def spherical_to_geographical_degrees(r, theta, phi):
         r, lat, lon = Coordinates.spherical_to_geographical_radians(r, theta, phi)
-        return r, degrees(lat), degrees(lon)
+        return r, lat * _DEGREES_PER_RADIAN, lon * _DEGREES_PER_RADIAN
 
     @staticmethod
     def geographical_radians_to_spherical(r, lat, lon):
         theta = 0.5 * pi - lat
-        phi = lon if lon >= 0 else lon + 2.0 * pi
+        phi = lon % (2.0 * pi)
         return r, theta, phi
 
     @staticmethod
     def geographical_degrees_to_spherical(r, lat, lon):
-        return Coordinates.geographical_radians_to_spherical(r, radians(lat), radians(lon))
+        return Coordinates.geographical_radians_to_spherical(
+            r, lat * _RADIANS_PER_DEGREE, lon * _RADIANS_PER_DEGREE,
+        )
 
 ####################################################################################################
 
 class Coordinate:
     """Position expressed in geographical coordinates with radians."""
 
+    __slots__ = ('lat', 'lon', '_slat', '_clat')
+
     def __init__(self, lat, lon) -> None:
         self.lat = lat
         self.lon = lon
 
+        # Sine and cosine of the latitude are needed by every calculation below.
+        self._slat = sin(lat)
+        self._clat = cos(lat)
+
+    @classmethod
+    def from_point(cls, point: 'Point') -> 'Coordinate':
+        """Converts spherical coordinates reusing `sin` and `cos` of `theta` for the latitude."""
+
+        coord = cls.__new__(cls)
+        coord.lat = 0.5 * pi - point.theta
+        coord.lon = remainder(point.phi, 2.0 * pi)
+        coord._slat = cos(point.theta)
+        coord._clat = sin(point.theta)
+        return coord
+
     def bearing_to(self, other: 'Coordinate') -> float:
         """Calculates bearing between two coordinates."""
 
-        x = sin(other.lon - self.lon) * cos(other.lat)
-        y = cos(self.lat) * sin(other.lat) - \
-            sin(self.lat) * cos(other.lat) * cos(other.lon - self.lon)
+        dlon = other.lon - self.lon
+        x = sin(dlon) * other._clat
+        y = self._clat * other._slat - self._slat * other._clat * cos(dlon)
 
         return atan2(x, y)
 
     def great_circle_distance_to(self, other: 'Coordinate', radius: float) -> float:
-        sin1 = sin(0.5 * abs(self.lat - other.lat))
-        sin2 = sin(0.5 * abs(self.lon - other.lon))
-        return 2 * radius * asin(sqrt(sin1 * sin1 + cos(self.lat) * cos(other.lat) * sin2 * sin2))
+        # The sines are squared, so the sign of the differences does not matter.
+        sin1 = sin(0.5 * (self.lat - other.lat))
+        sin2 = sin(0.5 * (self.lon - other.lon))
+        return 2 * radius * asin(sqrt(sin1 * sin1 + self._clat * other._clat * sin2 * sin2))
+
+    def great_circle_distance_to_many(
+            self,
+            lats: numpy.ndarray,
+            lons: numpy.ndarray,
+            radius: float,
+        ) -> numpy.ndarray:
+        """Calculates distances to many coordinates passed as arrays of latitudes and longitudes."""
+
+        sin1 = numpy.sin(0.5 * (self.lat - lats))
+        sin2 = numpy.sin(0.5 * (self.lon - lons))
+        return 2 * radius * numpy.arcsin(
+            numpy.sqrt(sin1 * sin1 + self._clat * numpy.cos(lats) * sin2 * sin2)
+        )
 
     def moved_by(self, distance, bearing, radius) -> 'Coordinate':
         angular_distance = distance / radius
@@ -87,8 +149,8 @@ class Coordinate:
         cb = cos(bearing)
         sb = sin(bearing)
 
-        slat1 = sin(self.lat)
-        clat1 = cos(self.lat)
+        slat1 = self._slat
+        clat1 = self._clat
 
         lat2 = asin(slat1 * cad + clat1 * sad * cb)
         slat2 = sin(lat2)
@@ -102,9 +164,32 @@ class Coordinate:
 
 ####################################################################################################
 
+# `sin`, `cos`, `acos` and `atan2` for single values and for arrays. They let `Point` and `Points`
+# share a single formula for movement.
+_SCALAR_TRIGONOMETRY = (sin, cos, acos, atan2)
+_ARRAY_TRIGONOMETRY = (numpy.sin, numpy.cos, numpy.arccos, numpy.arctan2)
+
+def _moved_by(theta, phi, distance, bearing, radius, trigonometry):
+    sin_, cos_, acos_, atan2_ = trigonometry
+
+    angular_distance = distance / radius
+    cad = cos_(angular_distance)
+    sad = sin_(angular_distance)
+
+    ct1 = cos_(theta)
+    st1 = sin_(theta)
+
+    theta2 = acos_(ct1 * cad + st1 * sad * cos_(bearing))
+    phi2 = phi + atan2_(sin_(bearing) * sad * st1, cad - ct1 * cos_(theta2))
+
+    return theta2, phi2 % (2.0 * pi)
+
+
 class Point:
     """Position expressed in spherical coordinates."""
 
+    __slots__ = ('theta', 'phi')
+
     class Schema(marshmallow.Schema):
         theta = mf.Float()
         phi = mf.Float()
@@ -117,60 +202,156 @@ class Point:
         self.theta = theta
         self.phi = phi
 
+    # The methods below use the same formulas as `Coordinate`, written directly in terms of `theta`
+    # and `phi`: `sin(lat) == cos(theta)`, `cos(lat) == sin(theta)` and differences of longitudes
+    # are equal to differences of `phi` modulo full turns.
+
     def bearing_to(self, other: 'Point') -> float:
         """Calculates bearing between two points expressed in spherical coordinates."""
 
-        coord1 = self.to_coordinate()
-        coord2 = other.to_coordinate()
-        return coord1.bearing_to(coord2)
+        dphi = other.phi - self.phi
+        st2 = sin(other.theta)
+        x = sin(dphi) * st2
+        y = sin(self.theta) * cos(other.theta) - cos(self.theta) * st2 * cos(dphi)
+
+        return atan2(x, y)
 
     def great_circle_distance_to(self, other: 'Point', radius: float) -> float:
-        coord1 = self.to_coordinate()
-        coord2 = other.to_coordinate()
-        return coord1.great_circle_distance_to(coord2, radius)
+        sin1 = sin(0.5 * (self.theta - other.theta))
+        sin2 = sin(0.5 * (self.phi - other.phi))
+        return 2 * radius * asin(sqrt(
+            sin1 * sin1 + sin(self.theta) * sin(other.theta) * sin2 * sin2
+        ))
+
+    def bearings_to(self, thetas: numpy.ndarray, phis: numpy.ndarray) -> numpy.ndarray:
+        """Calculates bearings to many points passed as arrays of `theta` and `phi` values."""
+
+        return Points.bearings(self.theta, self.phi, thetas, phis)
+
+    def great_circle_distance_to_many(
+            self,
+            thetas: numpy.ndarray,
+            phis: numpy.ndarray,
+            radius: float,
+        ) -> numpy.ndarray:
+        """Calculates distances to many points passed as arrays of `theta` and `phi` values."""
+
+        sin1 = numpy.sin(0.5 * (self.theta - thetas))
+        sin2 = numpy.sin(0.5 * (self.phi - phis))
+        return 2 * radius * numpy.arcsin(
+            numpy.sqrt(sin1 * sin1 + sin(self.theta) * numpy.sin(thetas) * sin2 * sin2)
+        )
 
     def moved_by(self, distance, bearing, radius) -> 'Point':
-        return self.to_coordinate().moved_by(distance, bearing, radius).to_point()
+        theta2, phi2 = _moved_by(
+            self.theta, self.phi, distance, bearing, radius, _SCALAR_TRIGONOMETRY,
+        )
+        return Point(theta2, phi2)
 
     def to_coordinate(self) -> Coordinate:
-        r, lat, lon = Coordinates.spherical_to_geographical_radians(1.0, self.theta, self.phi)
-        return Coordinate(lat, lon)
+        return Coordinate.from_point(self)
 
     def __str__(self) -> str:
         return f'Point(theta={self.theta}, phi={self.phi})'
 
 ####################################################################################################
 
+class Points:
+    """Batched operations on many positions expressed in spherical coordinates.
+
+    Positions are passed as separate arrays of `theta` and `phi` values. The results are equal to
+    applying the corresponding `Point` method to every position.
+    """
+
+    @staticmethod
+    def bearings(
+            thetas1: Union[float, numpy.ndarray],
+            phis1: Union[float, numpy.ndarray],
+            thetas2: numpy.ndarray,
+            phis2: numpy.ndarray,
+        ) -> numpy.ndarray:
+        dphi = phis2 - phis1
+        st1, ct1 = numpy.sin(thetas1), numpy.cos(thetas1)
+        st2, ct2 = numpy.sin(thetas2), numpy.cos(thetas2)
+        return numpy.arctan2(numpy.sin(dphi) * st2, st1 * ct2 - ct1 * st2 * numpy.cos(dphi))
+
+    @staticmethod
+    def moved_by(
+            thetas: numpy.ndarray,
+            phis: numpy.ndarray,
+            distances: numpy.ndarray,
+            bearings: numpy.ndarray,
+            radius: float,
+        ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        return _moved_by(thetas, phis, distances, bearings, radius, _ARRAY_TRIGONOMETRY)
+
+####################################################################################################
+
 Point3D = Tuple[float, float, float]
 Indices3D = Tuple[int, int, int]
 
 class Polyhedron:
     """"Polyhedron data container."""
 
-    def __init__(self, vertices: Iterable[Point3D], triangles: Iterable[Indices3D]) -> None:
-        # An ordered list of points.
-        self.vertices: List[Point3D] = list(vertices)
+    def __init__(
+            self,
+            vertices: Union[numpy.ndarray, Iterable[Point3D]],
+            triangles: Union[numpy.ndarray, Iterable[Indices3D]],
+        ) -> None:
+        # An ordered array of points, one per row.
+        if not isinstance(vertices, numpy.ndarray):
+            vertices = list(vertices)
+        self.vertices = numpy.array(vertices, dtype=numpy.float64).reshape(-1, 3)
+
+        # Unique triangles defined as sorted vertex indices, one per row.
+        if not isinstance(triangles, numpy.ndarray):
+            triangles = list(triangles)
+        indices = numpy.sort(numpy.array(triangles, dtype=numpy.int32).reshape(-1, 3), axis=1)
+        self.triangles = numpy.unique(indices, axis=0)
 
-        # A set of triangles defined as tuples of indices.
-        self.triangles: Set[Indices3D] = \
-            set(cast(Indices3D, tuple(sorted(indices))) for indices in triangles)
+    def get_vertices(self) -> numpy.ndarray:
+        return self.vertices
 
-    def get_vertices(self) -> Iterator[Tuple[float, float, float]]:
-        for vertex in self.vertices:
-            yield vertex
+    def get_triangles(self) -> numpy.ndarray:
+        return self.triangles
 
-    def get_triangles(self) -> Iterator[Tuple[float, float, float]]:
-        for triangle in self.triangles:
-            yield triangle
+    def rescale(self, stretch: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]) -> None:
+        """Moves every vertex along its radius to the distance returned by `stretch`.
 
-    def rescale(self, stretch: Callable[[Point], float]) -> None:
-        for i, vertex in enumerate(self.vertices):
-            r, theta, phi = Coordinates.cartesian_to_spherical(*vertex)
-            multiplier = stretch(Point(theta, phi)) / r
-            self.vertices[i] = cast(Point3D, tuple(cast(float, v * multiplier) for v in vertex))
+        `stretch` receives arrays of `theta` and `phi` of all the vertices and returns an array of
+        new radii.
+        """
+
+        rs, thetas, phis = Coordinates.cartesian_to_spherical(*self.vertices.T)
+        self.vertices *= (stretch(thetas, phis) / rs)[:, numpy.newaxis]
 
 ####################################################################################################
 
+def _make_icosahedron_vertices() -> numpy.ndarray:
+    f = (sqrt(5.0) + 1.0) / 2.0
+    b = sqrt(2.0 / (5.0 + sqrt(5.0)))
+    a = b * f
+
+    return numpy.array(
+        (( 0, b, a), ( 0, b,-a), ( 0,-b, a), ( 0,-b,-a),
+         ( a, 0, b), ( a, 0,-b), (-a, 0, b), (-a, 0,-b),
+         ( b, a, 0), ( b,-a, 0), (-b, a, 0), (-b,-a, 0)),
+        dtype=numpy.float64,
+    )
+
+
+# Icosahedron data is constant, so it is prepared only once. `Polyhedron` copies it on construction.
+_ICOSAHEDRON_VERTICES = _make_icosahedron_vertices()
+_ICOSAHEDRON_TRIANGLES = numpy.array(
+    ((0,  2, 4), (0,  2, 6), (1,  3,  5), (1,  3,  7),
+     (4,  5, 8), (4,  5, 9), (6,  7, 10), (6,  7, 11),
+     (8, 10, 0), (8, 10, 1), (9, 11,  2), (9, 11,  3),
+     (4,  8, 0), (5,  8, 1), (4,  9,  2), (5,  9,  3),
+     (6, 10, 0), (7, 10, 1), (6, 11,  2), (7, 11,  3)),
+    dtype=numpy.int32,
+)
+
+
 class Structures:
     """Structures generator class."""
 
@@ -178,78 +359,52 @@ class Structures:
     def icosahedron() -> Polyhedron:
         """Icosahedron generation function"""
 
-        f = (sqrt(5.0) + 1.0) / 2.0
-        b = sqrt(2.0 / (5.0 + sqrt(5.0)))
-        a = b * f
-
-        return Polyhedron(
-            (( 0, b, a), ( 0, b,-a), ( 0,-b, a), ( 0,-b,-a),
-             ( a, 0, b), ( a, 0,-b), (-a, 0, b), (-a, 0,-b),
-             ( b, a, 0), ( b,-a, 0), (-b, a, 0), (-b,-a, 0)),
-            {(0,  2, 4), (0,  2, 6), (1,  3,  5), (1,  3,  7),
-             (4,  5, 8), (4,  5, 9), (6,  7, 10), (6,  7, 11),
-             (8, 10, 0), (8, 10, 1), (9, 11,  2), (9, 11,  3),
-             (4,  8, 0), (5,  8, 1), (4,  9,  2), (5,  9,  3),
-             (6, 10, 0), (7, 10, 1), (6, 11,  2), (7, 11,  3)}
-        )
+        return Polyhedron(_ICOSAHEDRON_VERTICES, _ICOSAHEDRON_TRIANGLES)
 
     @staticmethod
     def sphere(n, radius=1.0) -> Polyhedron:
         """Sphere generation function"""
 
-        def scaled(vector):
-            length_inv = 1.0 / sqrt(sum(v*v for v in vector))
-            return tuple([radius * v * length_inv for v in vector])
-
-        def nm(v1, v2):
-            return scaled([0.5 * (v1[i] + v2[i]) for i in range(0, len(v1))])
-
-        def index(v):
-            if v not in indices:
-                indices[v] = len(vertices)
-                vertices.append(v)
-
-            return indices[v]
+        def scaled(vectors: numpy.ndarray) -> numpy.ndarray:
+            lengths = numpy.sqrt(numpy.einsum('ij,ij->i', vectors, vectors))
+            return vectors * (radius / lengths)[:, None]
 
-        icosahedron = Structures.icosahedron()
-        vertices = [scaled(v) for v in icosahedron.vertices]
-        old_triangles = icosahedron.triangles
-        indices = {v: i for i, v in enumerate(vertices)}
+        vertices = scaled(_ICOSAHEDRON_VERTICES)
+        triangles = _ICOSAHEDRON_TRIANGLES.astype(numpy.int64)
 
         for i in range(0, n):
-            new_triangles = set()
+            # Edges opposite to the first, second and third vertex of each triangle. Every edge is
+            # shared by two triangles so the midpoints are deduplicated by the edge end indices.
+            edges = numpy.sort(triangles[:, [[1, 2], [0, 2], [0, 1]]], axis=2).reshape(-1, 2)
+            unique_edges, inverse = numpy.unique(edges, axis=0, return_inverse=True)
+            midpoints = scaled(0.5 * (vertices[unique_edges[:, 0]] + vertices[unique_edges[:, 1]]))
+
+            p = inverse.reshape(-1, 3) + len(vertices)
+            t = triangles
+            vertices = numpy.concatenate((vertices, midpoints))
+            triangles = numpy.concatenate((
+                numpy.stack((t[:, 0], p[:, 1], p[:, 2]), axis=1),
+                numpy.stack((t[:, 1], p[:, 0], p[:, 2]), axis=1),
+                numpy.stack((t[:, 2], p[:, 0], p[:, 1]), axis=1),
+                p,
+            ))
+
+        return Polyhedron(vertices, triangles)
 
-            for t in old_triangles:
-                v0 = nm(vertices[t[1]], vertices[t[2]])
-                v1 = nm(vertices[t[0]], vertices[t[2]])
-                v2 = nm(vertices[t[0]], vertices[t[1]])
-
-                p0 = index(v0)
-                p1 = index(v1)
-                p2 = index(v2)
-
-                new_triangles.update([(t[0], p1, p2)])
-                new_triangles.update([(t[1], p0, p2)])
-                new_triangles.update([(t[2], p0, p1)])
-                new_triangles.update([(p0, p1, p2)])
-
-            old_triangles = new_triangles
+####################################################################################################
 
-        return Polyhedron(vertices, new_triangles)
+_IDENTITY_4 = numpy.eye(4, dtype=numpy.float32)
+_IDENTITY_3 = numpy.eye(3, dtype=numpy.float32)
 
-####################################################################################################
+# The matrix builders below copy a preallocated template and set only the non-trivial entries. This
+# is much cheaper than converting a nested list into an array on every call.
 
 class Matrices3D:
     """Generator for 3D transformations."""
 
     @staticmethod
     def identity() -> numpy.array:
-        return numpy.array([
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, 1],
-        ], dtype=numpy.float32)
+        return _IDENTITY_4.copy()
 
     @staticmethod
     def perspective(
@@ -260,15 +415,13 @@ class Matrices3D:
             far: float,
         ) -> numpy.array:
         s = 1.0 / tan(0.5 * fovy)
-        sx, sy = s * height / width, s
-        zz = (far + near) / (near - far)
-        zw = 2 * far * near / (near - far)
-        return numpy.array([
-            [sx,  0,  0,  0],
-            [ 0, sy,  0,  0],
-            [ 0,  0, zz, zw],
-            [ 0,  0, -1,  0],
-        ], dtype=numpy.float32)
+        m = numpy.zeros((4, 4), dtype=numpy.float32)
+        m[0, 0] = s * height / width
+        m[1, 1] = s
+        m[2, 2] = (far + near) / (near - far)
+        m[2, 3] = 2 * far * near / (near - far)
+        m[3, 2] = -1
+        return m
 
     @staticmethod
     def orthographic(
@@ -282,96 +435,154 @@ class Matrices3D:
         wr = 1.0 / (right - left)
         hr = 1.0 / (top - bottom)
         dr = 1.0 / (far - near)
-        return numpy.array([
-            [2.0 * wr,        0,         0, -(right + left) * wr],
-            [       0, 2.0 * hr,         0, -(top + bottom) * hr],
-            [       0,        0, -2.0 * dr,   -(far + near) * dr],
-            [       0,        0,         0,                    1],
-        ], dtype=numpy.float32)
+        m = _IDENTITY_4.copy()
+        m[0, 0] = 2.0 * wr
+        m[1, 1] = 2.0 * hr
+        m[2, 2] = -2.0 * dr
+        m[0, 3] = -(right + left) * wr
+        m[1, 3] = -(top + bottom) * hr
+        m[2, 3] = -(far + near) * dr
+        return m
 
     @staticmethod
     def translation(vector: Tuple[float, float, float]) -> numpy.array:
-        x, y, z = vector
-        return numpy.array([
-            [1, 0, 0, x],
-            [0, 1, 0, y],
-            [0, 0, 1, z],
-            [0, 0, 0, 1],
-        ], dtype=numpy.float32)
+        m = _IDENTITY_4.copy()
+        m[:3, 3] = vector
+        return m
 
     @staticmethod
     def rotation_x(a: float) -> numpy.array:
         c, s = cos(a), sin(a)
-        return numpy.array([
-            [1.0, 0.0, 0.0, 0.0],
-            [0.0,   c,  -s, 0.0],
-            [0.0,   s,   c, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-        ], dtype=numpy.float32)
+        m = _IDENTITY_4.copy()
+        m[1, 1] = c
+        m[1, 2] = -s
+        m[2, 1] = s
+        m[2, 2] = c
+        return m
 
     @staticmethod
     def rotation_y(a: float) -> numpy.array:
         c, s = cos(a), sin(a)
-        return numpy.array([
-            [  c, 0.0,   s, 0.0],
-            [0.0, 1.0, 0.0, 0.0],
-            [ -s, 0.0,   c, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-        ], dtype=numpy.float32)
+        m = _IDENTITY_4.copy()
+        m[0, 0] = c
+        m[0, 2] = s
+        m[2, 0] = -s
+        m[2, 2] = c
+        return m
 
     @staticmethod
     def rotation_z(a: float) -> numpy.array:
         c, s = cos(a), sin(a)
-        return numpy.array([
-            [  c,  -s, 0.0, 0.0],
-            [  s,   c, 0.0, 0.0],
-            [0.0, 0.0, 1.0, 0.0],
-            [0.0, 0.0, 0.0, 1.0],
-        ], dtype=numpy.float32)
+        m = _IDENTITY_4.copy()
+        m[0, 0] = c
+        m[0, 1] = -s
+        m[1, 0] = s
+        m[1, 1] = c
+        return m
+
+    @staticmethod
+    def transform_batch(
+            matrix: numpy.ndarray,
+            vectors: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None,
+        ) -> numpy.ndarray:
+        """Transforms many homogeneous vectors stacked as columns of a (4, N) array at once.
+
+        If `out` is passed the result is written into it instead of a newly allocated array.
+        """
+
+        return numpy.matmul(matrix, vectors, out=out)
 
     @staticmethod
-    def personal_to_global(theta, phi, bearing) -> numpy.array:
-        return Matrices3D.rotation_y(phi) \
-             @ Matrices3D.rotation_x(theta) \
-             @ Matrices3D.rotation_y(-bearing)
+    def transform_points(
+            matrix: numpy.ndarray,
+            points: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None,
+        ) -> numpy.ndarray:
+        """Applies an affine transformation to many points stacked as rows of a (N, 3) array.
+
+        No homogeneous coordinate is needed, only the 3x3 block and the translation are applied. If
+        `out` is passed the result is written into it instead of a newly allocated array.
+        """
+
+        result = numpy.matmul(points, matrix[:3, :3].T, out=out)
+        result += matrix[:3, 3]
+        return result
+
+    @staticmethod
+    def personal_to_global(
+            theta: float,
+            phi: float,
+            bearing: float,
+            out: Optional[numpy.ndarray] = None,
+        ) -> numpy.ndarray:
+        """Returns `rotation_y(phi) @ rotation_x(theta) @ rotation_y(-bearing)` in expanded form.
+
+        The terms are rounded to `float32` at the same steps as in the product of the `float32`
+        rotation matrices. The movement in `World` accumulates these values over many steps, so the
+        result has to keep the precision of the product and not only approximate it.
+
+        If `out` is passed the matrix is written into it instead of a newly allocated one.
+        """
+
+        f32 = numpy.float32
+        ct, st, cp, sp, cb, sb = numpy.array(
+            (cos(theta), sin(theta), cos(phi), sin(phi), cos(bearing), sin(bearing)), f32,
+        ).tolist()
+
+        # Products of two `float32` values are exact in `float64`, so rounding them afterwards gives
+        # the same result as multiplying in `float32`. The same holds for the final sums.
+        spct, cpct, cpcb, cpsb, spcb, spsb = numpy.array(
+            (sp * ct, cp * ct, cp * cb, cp * sb, sp * cb, sp * sb), f32,
+        ).tolist()
+        spctsb, spctcb, cpctsb, cpctcb = numpy.array(
+            (spct * sb, spct * cb, cpct * sb, cpct * cb), f32,
+        ).tolist()
+
+        if out is None:
+            m = _IDENTITY_4.copy()
+        else:
+            m = out
+            m[:] = _IDENTITY_4
+        m[0, 0] = cpcb + spctsb
+        m[0, 1] = sp * st
+        m[0, 2] = spctcb - cpsb
+        m[1, 0] = -st * sb
+        m[1, 1] = ct
+        m[1, 2] = -st * cb
+        m[2, 0] = cpctsb - spcb
+        m[2, 1] = cp * st
+        m[2, 2] = spsb + cpctcb
+        return m
 
 class Matrices2D:
     """Generator for 2D transformations."""
 
     @staticmethod
     def identity() -> numpy.array:
-        return numpy.array([
-            [1, 0, 0],
-            [0, 1, 0],
-            [0, 0, 1],
-        ], dtype=numpy.float32)
+        return _IDENTITY_3.copy()
 
     @staticmethod
     def translation(vector: Tuple[float, float]) -> numpy.array:
-        x, y = vector
-        return numpy.array([
-            [1, 0, x],
-            [0, 1, y],
-            [0, 0, 1],
-        ], dtype=numpy.float32)
+        m = _IDENTITY_3.copy()
+        m[:2, 2] = vector
+        return m
 
     @staticmethod
     def rotation(a: float) -> numpy.array:
         c, s = cos(a), sin(a)
-        return numpy.array([
-            [  c,  -s, 0.0],
-            [  s,   c, 0.0],
-            [0.0, 0.0, 1.0],
-        ], dtype=numpy.float32)
+        m = _IDENTITY_3.copy()
+        m[0, 0] = c
+        m[0, 1] = -s
+        m[1, 0] = s
+        m[1, 1] = c
+        return m
 
     @staticmethod
     def scale(scale: Tuple[float, float]) -> numpy.array:
-        x, y = scale
-        return numpy.array([
-            [  x, 0.0, 0.0],
-            [0.0,   y, 0.0],
-            [0.0, 0.0, 1.0],
-        ], dtype=numpy.float32)
+        m = _IDENTITY_3.copy()
+        m[0, 0], m[1, 1] = scale
+        return m
 
 ####################################################################################################
 
@@ -386,6 +597,10 @@ class Boundary2D:
         return self.left < x and x < self.right and self.bottom < y and y < self.top
 
 
+# Tiles copy this template so only the corner coordinates need to be filled in.
+_TILE_POINTS_TEMPLATE = numpy.ones((3, 4), dtype=numpy.float32)
+
+
 class Tile:
     def __init__(
         self,
@@ -394,12 +609,11 @@ class Tile:
         size: Tuple[float, float],
     ) -> None:
         self.id = id
-        self.points = [
-            numpy.array([position[0],           position[1]          , 1.0], dtype=numpy.float32),
-            numpy.array([position[0],           position[1] + size[1], 1.0], dtype=numpy.float32),
-            numpy.array([position[0] + size[0], position[1] + size[1], 1.0], dtype=numpy.float32),
-            numpy.array([position[0] + size[0], position[1]          , 1.0], dtype=numpy.float32),
-        ]
+        x0, y0 = position
+        x1, y1 = x0 + size[0], y0 + size[1]
+        # Homogeneous coordinates of the four corners, one point per column.
+        self.points = _TILE_POINTS_TEMPLATE.copy()
+        self.points[:2] = ((x0, x0, x1, x1), (y0, y1, y1, y0))
 
     def rotate(self, angle: float) -> None:
         self.transform(Matrices2D.rotation(angle))
@@ -411,8 +625,7 @@ class Tile:
         self.transform(Matrices2D.scale(vector))
 
     def transform(self, matrix: numpy.array) -> None:
-        for i, point in enumerate(self.points):
-            self.points[i] = matrix @ point.reshape(3, 1)
+        self.points = matrix @ self.points
 
     def rotated(self, angle: float) -> 'Tile':
         self.rotate(angle)
@@ -431,7 +644,7 @@ class Tile:
         return self
 
     def __repr__(self) -> str:
-        return f'Tile(id={self.id}, points={self.points})'
+        return f'Tile(id={self.id}, points={self.points.T.tolist()})'
 
 ####################################################################################################
 
@@ -441,8 +654,47 @@ class _Terrains(enum.Enum):
     CONTINENTS = 'continents'
 
 
+class _TerrainSample:
+    """Trigonometric terms of a position shared by all the terrain types.
+
+    Computing them once per position avoids repeating the same work for every terrain component.
+    """
+
+    __slots__ = ('u', 'sin_theta', 'sin_phi', 'sin_50_theta', 'sin_50_phi', 'cos_10_theta', 'cos_10_phi')
+
+    def __init__(self, theta: float, phi: float) -> None:
+        self.u = theta / pi
+        self.sin_theta = sin(theta)
+        self.sin_phi = sin(phi)
+        self.sin_50_theta = sin(50 * theta)
+        self.sin_50_phi = sin(50 * phi)
+        self.cos_10_theta = cos(10 * theta)
+        self.cos_10_phi = cos(10 * phi)
+
+    @classmethod
+    def of_many(cls, thetas: numpy.ndarray, phis: numpy.ndarray) -> '_TerrainSample':
+        """Creates a sample holding arrays of terms for many positions at once.
+
+        Terrains evaluate such a sample with the same code, producing an array of elevations.
+        """
+
+        sample: Any = cls.__new__(cls)
+        sample.u = thetas / pi
+        sample.sin_theta = numpy.sin(thetas)
+        sample.sin_phi = numpy.sin(phis)
+        sample.sin_50_theta = numpy.sin(50 * thetas)
+        sample.sin_50_phi = numpy.sin(50 * phis)
+        sample.cos_10_theta = numpy.cos(10 * thetas)
+        sample.cos_10_phi = numpy.cos(10 * phis)
+        return sample
+
+
 class _TerrainInfo(abc.ABC):
     def evaluate(self, pos: Point, radius: float) -> float:
+        return self.evaluate_sample(_TerrainSample(pos.theta, pos.phi), radius)
+
+    @abc.abstractmethod
+    def evaluate_sample(self, sample: _TerrainSample, radius: float) -> float:
         pass
 
 
@@ -457,10 +709,10 @@ class Hills(_TerrainInfo):
         def make(self, data, **kwargs):
             return Hills(**data)
 
-    def evaluate(self, pos: Point, radius: float) -> float:
-        return 0.006 * radius \
-            * (pos.theta / pi - 1) * sin(50 * pos.phi) \
-            * (pos.theta / pi - 2) * sin(50 * pos.theta)
+    def evaluate_sample(self, sample: _TerrainSample, radius: float) -> float:
+        # (u - 1) * (u - 2) expanded
+        u = sample.u
+        return 0.006 * radius * (u * u - 3 * u + 2) * sample.sin_50_phi * sample.sin_50_theta
 
 
 @dataclass
@@ -474,8 +726,9 @@ class Ranges(_TerrainInfo):
         def make(self, data, **kwargs):
             return Ranges(**data)
 
-    def evaluate(self, pos: Point, radius: float) -> float:
-        return 0.012 * radius * cos(10 * pos.theta + pi) * cos(10 * pos.phi)
+    def evaluate_sample(self, sample: _TerrainSample, radius: float) -> float:
+        # cos(10 * theta + pi) == -cos(10 * theta)
+        return -0.012 * radius * sample.cos_10_theta * sample.cos_10_phi
 
 
 @dataclass
@@ -489,15 +742,15 @@ class Continents(_TerrainInfo):
         def make(self, data, **kwargs):
             return Continents(**data)
 
-    def evaluate(self, pos: Point, radius: float) -> float:
-        return 0.018 * radius * sin(pos.theta) * sin(pos.phi)
+    def evaluate_sample(self, sample: _TerrainSample, radius: float) -> float:
+        return 0.018 * radius * sample.sin_theta * sample.sin_phi
 
 
 class _TerrainSchema(OneOfSchema):
     type_schemas = {
-        _Terrains.HILLS.value: Hills.Schema,
-        _Terrains.RANGES.value: Ranges.Schema,
-        _Terrains.CONTINENTS.value: Continents.Schema,
+        _Terrains.HILLS.value: Hills.Schema(),
+        _Terrains.RANGES.value: Ranges.Schema(),
+        _Terrains.CONTINENTS.value: Continents.Schema(),
     }
 
     type_names = {
@@ -521,7 +774,6 @@ class ElevationFunction:
 
         @marshmallow.post_load
         def make(self, data, **kwargs):
-            schema = _TerrainSchema()
             ef = ElevationFunction(data['radius'])
             ef.terrain = data['terrain']
             return ef
@@ -537,8 +789,27 @@ class ElevationFunction:
         return self.radius
 
     def evaluate_without_radius(self, position: Point) -> float:
-        return sum(terrain.evaluate(position, self.radius) for terrain in self.terrain)
+        sample = _TerrainSample(position.theta, position.phi)
+        radius = self.radius
+        result = 0.0
+        for terrain in self.terrain:
+            result += terrain.evaluate_sample(sample, radius)
+        return result
 
     def evaluate_with_radius(self, position: Point) -> float:
         return self.radius + self.evaluate_without_radius(position)
 
+    def evaluate_many_without_radius(
+            self,
+            thetas: numpy.ndarray,
+            phis: numpy.ndarray,
+        ) -> numpy.ndarray:
+        sample = _TerrainSample.of_many(thetas, phis)
+        result = numpy.zeros(numpy.shape(thetas))
+        for terrain in self.terrain:
+            result += terrain.evaluate_sample(sample, self.radius)
+        return result
+
+    def evaluate_many_with_radius(self, thetas: numpy.ndarray, phis: numpy.ndarray) -> numpy.ndarray:
+        return self.radius + self.evaluate_many_without_radius(thetas, phis)
+
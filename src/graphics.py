@@ -10,15 +10,9 @@ from . import defs, formations, geometry, media, skeleton
 
 class SolidPolyhedronRenderer:
     def __init__(self, figure, texture_id) -> None:
-        vertices = numpy.array(
-            [value for vertex in figure.get_vertices() for value in vertex],
-            dtype=numpy.float32
-        )
+        vertices = numpy.ravel(figure.get_vertices()).astype(numpy.float32)
 
-        indices = numpy.array(
-            [value for index in figure.get_triangles() for value in index],
-            dtype=numpy.uint32
-        )
+        indices = numpy.ravel(figure.get_triangles()).astype(numpy.uint32)
 
         self._texture_id = texture_id
         self._index_count = len(indices)
@@ -160,10 +154,10 @@ class SkeletonRenderer:
         data = []
         for i, tile in enumerate(tiles):
             data.append([
-                    tile.points[0][0], tile.points[0][1], SEPARATION * i, 0.0, 1.0,
-                    tile.points[1][0], tile.points[1][1], SEPARATION * i, 0.0, 0.0,
-                    tile.points[2][0], tile.points[2][1], SEPARATION * i, 1.0, 0.0,
-                    tile.points[3][0], tile.points[3][1], SEPARATION * i, 1.0, 1.0,
+                    tile.points[0, 0], tile.points[1, 0], SEPARATION * i, 0.0, 1.0,
+                    tile.points[0, 1], tile.points[1, 1], SEPARATION * i, 0.0, 0.0,
+                    tile.points[0, 2], tile.points[1, 2], SEPARATION * i, 1.0, 0.0,
+                    tile.points[0, 3], tile.points[1, 3], SEPARATION * i, 1.0, 1.0,
                 ])
         return numpy.array(data, dtype=numpy.float32).flatten()
 
@@ -274,9 +268,12 @@ class PositionedSkeletonRenderer:
         bottom = self._skeleton.get_interaction().hover_area.bottom
 
         trans = self._view @ self._model
-        left_bottom = (trans @ numpy.array((left, bottom, 0.0, 1.0)).reshape(4, 1)).flatten()
-        right_top = (trans @ numpy.array((right, top, 0.0, 1.0)).reshape(4, 1)).flatten()
-        center = (trans @ numpy.array((0.0, 0.0, 0.0, 1.0)).reshape(4, 1)).flatten()
+        corners = numpy.array((
+            (left, bottom, 0.0, 1.0),
+            (right, top, 0.0, 1.0),
+            (0.0, 0.0, 0.0, 1.0),
+        )).T
+        left_bottom, right_top, center = geometry.Matrices3D.transform_batch(trans, corners).T
 
         self._cam_left = left_bottom[0] / left_bottom[3]
         self._cam_bottom = left_bottom[1] / left_bottom[3]
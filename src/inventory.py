@@ -4,7 +4,7 @@ import marshmallow
 from marshmallow import fields as mf
 from marshmallow_enum import EnumField
 
-from typing import Iterable, List, Optional, Set
+from typing import Iterable, List, Optional, Set, Tuple
 
 from . import craft, defs, settings
 
@@ -15,6 +15,8 @@ class EntityInfo:
 
     MAX_VOLUME = settings.Sizes.HUGE.value
 
+    __slots__ = ('id', 'essence', 'current_quantity', 'item_volume', 'codename')
+
     id: defs.ActorId
     essence: craft.Essence
     current_quantity: int
@@ -76,6 +78,8 @@ class Inventory:
 
             return inv
 
+    __slots__ = ('left_hand', 'right_hand', 'entries')
+
     def __init__(self) -> None:
         self.left_hand: Optional[EntityInfo] = None
         self.right_hand: Optional[EntityInfo] = None
@@ -106,19 +110,7 @@ class Inventory:
         return self.entries[index] if self.is_index_valid(index) else None
 
     def get_all_ids(self) -> Iterable[defs.ActorId]:
-        result = list()
-
-        if self.left_hand is not None:
-            result.append(self.left_hand.id)
-
-        if self.right_hand is not None:
-            result.append(self.right_hand.id)
-
-        for entry in self.entries:
-            if entry is not None:
-                result.append(entry.id)
-
-        return result
+        return [entry.id for entry in self._all_entries() if entry is not None]
 
     def store(
             self,
@@ -165,19 +157,7 @@ class Inventory:
                 self.right_hand = entry
 
     def to_items(self) -> Set[craft.Item]:
-        result: Set[craft.Item] = set()
-
-        if self.left_hand is not None:
-            result.add(self.left_hand.to_item())
-
-        if self.right_hand is not None:
-            result.add(self.right_hand.to_item())
-
-        for entry in self.entries:
-            if entry is not None:
-                result.add(entry.to_item())
-
-        return result
+        return {entry.to_item() for entry in self._all_entries() if entry is not None}
 
     def get_free_hand(self, prefered=defs.Hand.RIGHT) -> Optional[defs.Hand]:
         hand = None
@@ -188,13 +168,7 @@ class Inventory:
         return hand
 
     def find_entity_with_entity_id(self, entity_id: defs.ActorId) -> Optional[EntityInfo]:
-        if self.left_hand is not None and self.left_hand.id == entity_id:
-            return self.left_hand
-
-        if self.right_hand is not None and self.right_hand.id == entity_id:
-            return self.right_hand
-
-        for entry in self.entries:
+        for entry in self._all_entries():
             if entry is not None and entry.id == entity_id:
                 return entry
 
@@ -217,3 +191,8 @@ class Inventory:
     def is_index_valid(self, index: int) -> bool:
         return -1 < index and index < defs.INVENTORY_SIZE
 
+    def _all_entries(self) -> Tuple[Optional[EntityInfo], ...]:
+        """Returns entries of both hands followed by the pocket entries."""
+
+        return (self.left_hand, self.right_hand, *self.entries)
+
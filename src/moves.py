@@ -114,7 +114,7 @@ _MOVES = cast(Sequence[defs.Serializable], (
 class MoveSchema(OneOfSchema):
     """A schema for any type of action."""
 
-    type_schemas = { cls.SERIALIZATION_NAME: cls.Schema for cls in _MOVES }
+    type_schemas = { cls.SERIALIZATION_NAME: cls.Schema() for cls in _MOVES }
     type_names = { cls: cls.SERIALIZATION_NAME for cls in _MOVES }
 
     def get_obj_type(self, obj):
@@ -125,6 +125,10 @@ class MoveSchema(OneOfSchema):
             raise Exception("Unknown object type: {}".format(obj.__class__.__name__))
 
 
+# Schemas are stateless, so a single instance is shared instead of being built for every move.
+_MOVE_SCHEMA = MoveSchema()
+
+
 def move_from_json_string(string: str) -> Optional[Move]:
     """
     Converts a JSON string into a move.
@@ -133,7 +137,7 @@ def move_from_json_string(string: str) -> Optional[Move]:
 
     try:
         data = json.loads(string)
-        res = MoveSchema().load(data)
+        res = _MOVE_SCHEMA.load(data)
         return res
     except Exception as e:
         print(f'Move deserialisation failure: {e} - ({string})')
@@ -33,5 +33,7 @@ RECIPES = [
     ),
 ]
 
+RECIPES_BY_CODENAME: Dict[str, Recipe] = {recipe.get_codename(): recipe for recipe in RECIPES}
+
 ENTITIES: Dict[str, Any] = dict()
 
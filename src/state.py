@@ -1,17 +1,21 @@
 import random, sys
 
-from typing import Iterable, List, Optional
+import numpy
+
+from typing import Callable, Iterable, List, Optional, cast
 
 from . import craft, defs, essentials, features, inventory, geometry, scene, settings
 
 class CraftResult:
     def __init__(
             self,
-            created: List[scene.Actor] = list(),
-            deleted: List[defs.ActorId] = list(),
+            created: Optional[List[scene.Actor]] = None,
+            deleted: Optional[List[defs.ActorId]] = None,
         ) -> None:
-        self.created = created
-        self.deleted = deleted
+        # Default lists must not be shared between instances, otherwise every craft would keep
+        # accumulating the results of all the previous ones.
+        self.created = created if created is not None else list()
+        self.deleted = deleted if deleted is not None else list()
 
     def add_for_creation(self, created: scene.Actor) -> None:
         self.created.append(created)
@@ -55,20 +59,11 @@ class State:
             claim: Iterable[features.Claim],
             max_distance: float,
         ) -> Optional[defs.ActorId]:
-        reference = self.get_entity(reference_id)
-        if reference is None:
-            return None
-
-        min_id = None
-        min_distance = 100 * self.get_radius()
-        for entity in self.entities.values():
-            if entity.get_id() != reference_id and entity.features.deliver(claim):
-                distance = self.calculate_distance(reference, entity)
-                if distance is not None and distance < min_distance:
-                    min_distance = distance
-                    min_id = entity.get_id()
-
-        return min_id
+        return self._find_closest_within(
+            reference_id,
+            lambda entity: entity.features.deliver(claim),
+            max_distance,
+        )
 
     def find_closest_absorbing_within(
             self,
@@ -76,20 +71,39 @@ class State:
             claims: Iterable[features.Claim],
             max_distance: float,
         ) -> Optional[defs.ActorId]:
+        return self._find_closest_within(
+            reference_id,
+            lambda entity: entity.features.absorb(claims),
+            max_distance,
+        )
+
+    def _find_closest_within(
+            self,
+            reference_id: defs.ActorId,
+            predicate: Callable[[essentials.Entity], bool],
+            max_distance: float,
+        ) -> Optional[defs.ActorId]:
         reference = self.get_entity(reference_id)
-        if reference is None:
+        if reference is None or reference.position is None:
             return None
 
-        min_id = None
-        min_distance = 100 * self.get_radius()
-        for entity in self.entities.values():
-            if entity.get_id() != reference_id and entity.features.absorb(claims):
-                distance = self.calculate_distance(reference, entity)
-                if distance is not None and distance < min_distance:
-                    min_distance = distance
-                    min_id = entity.get_id()
+        candidates = [
+            entity for entity in self.entities.values()
+            if entity.get_id() != reference_id and entity.position is not None and predicate(entity)
+        ]
+        if len(candidates) == 0:
+            return None
+
+        # Distances to all the candidates are calculated in one batch.
+        thetas = numpy.array([cast(geometry.Point, e.position).theta for e in candidates])
+        phis = numpy.array([cast(geometry.Point, e.position).phi for e in candidates])
+        distances = reference.position.great_circle_distance_to_many(thetas, phis, self.get_radius())
+
+        index = int(numpy.argmin(distances))
+        if distances[index] > max_distance:
+            return None
 
-        return min_id
+        return candidates[index].get_id()
 
     def add_entity(self, entity: essentials.Entity) -> None:
         if entity.get_id() < 0:
@@ -234,10 +248,7 @@ class State:
             inventory.remove_with_entity_id(source_entry.id)
 
     def _find_recipe_by_codename(self, codename: str) -> Optional[craft.Recipe]:
-        for recipe in settings.RECIPES:
-            if recipe.get_codename() == codename:
-                return recipe
-        return None
+        return settings.RECIPES_BY_CODENAME.get(codename, None)
 
     def generate_new_entity_id(self) -> defs.ActorId:
         while True:
@@ -1,8 +1,8 @@
 import time
 
-from typing import List, Optional, Sequence, cast
+from typing import List, Optional, Sequence, Tuple, cast
 
-from . import actions, craft, defs, essentials, features, events, jobs, scene, state
+from . import actions, craft, defs, essentials, features, events, geometry, jobs, scene, state
 
 
 class MovementTask(essentials.Task):
@@ -14,9 +14,11 @@ class MovementTask(essentials.Task):
         self.speed = speed
         self.bearing = bearing
         self.job = jobs.MovementJob(entity_id, self.speed, self.bearing, self.TIMEOUT, list())
+        self._start_actions: Sequence[actions.Action] = \
+            (actions.MovementAction(entity_id, speed, bearing, self.TIMEOUT),)
 
     def start(self, state: state.State) -> Sequence[actions.Action]:
-        return [actions.MovementAction(self.entity_id, self.speed, self.bearing, self.TIMEOUT)]
+        return self._start_actions
 
     def get_job(self) -> Optional[essentials.Job]:
         return self.job
@@ -48,18 +50,21 @@ class WalkTask(essentials.Task):
         self.speed = speed
         self.bearing = bearing
         self.duration = duration
+        self.job = jobs.MovementJob(
+                entity_id,
+                speed,
+                bearing,
+                duration,
+                [events.FinishedEvent(entity_id)],
+            )
+        self._start_actions: Sequence[actions.Action] = \
+            (actions.MovementAction(entity_id, speed, bearing, duration),)
 
     def start(self, state: state.State) -> Sequence[actions.Action]:
-        return [actions.MovementAction(self.entity_id, self.speed, self.bearing, self.duration)]
+        return self._start_actions
 
     def get_job(self) -> Optional[essentials.Job]:
-        return jobs.MovementJob(
-                self.entity_id,
-                self.speed,
-                self.bearing,
-                self.duration,
-                [events.FinishedEvent(self.entity_id)],
-            )
+        return self.job
 
     def finish(self, state: state.State) -> Sequence[actions.Action]:
         entity = state.get_entity(self.entity_id)
@@ -85,6 +90,10 @@ class PickItemTask(essentials.Task):
         self.hand = hand
         self.job: Optional[essentials.Job] = None
 
+        # Positions for which the distance was checked in `start`. Positions are replaced rather than
+        # modified when entities move, so if they are the same in `finish` the check can be skipped.
+        self._checked_positions: Optional[Tuple[geometry.Point, geometry.Point]] = None
+
     def start(self, state: state.State) -> Sequence[actions.Action]:
         if self.what_id is None:
             self.what_id = state.find_closest_delivering_within \
@@ -98,8 +107,7 @@ class PickItemTask(essentials.Task):
         if entity is None or item is None:
             return list()
 
-        distance = state.calculate_distance(entity, item)
-        if distance is None or self.MAX_DISTANCE < distance:
+        if not self._is_within_reach(state, entity, item):
             return list()
 
         if self.what_id is not None:
@@ -123,8 +131,7 @@ class PickItemTask(essentials.Task):
         if not entity.features.inventory or not item.features.inventorable:
             return list()
 
-        distance = state.calculate_distance(entity, item)
-        if distance is None or self.MAX_DISTANCE < distance:
+        if not self._is_within_reach(state, entity, item):
             return list()
 
         entity.features.inventory.store_entry(self.hand, item.as_info())
@@ -138,6 +145,26 @@ class PickItemTask(essentials.Task):
 
         return result
 
+    def _is_within_reach(
+            self,
+            state: state.State,
+            entity: essentials.Entity,
+            item: essentials.Entity,
+        ) -> bool:
+        if entity.position is None or item.position is None:
+            return False
+
+        checked = self._checked_positions
+        if checked is not None and checked[0] is entity.position and checked[1] is item.position:
+            return True
+
+        distance = state.calculate_distance(entity, item)
+        if distance is None or self.MAX_DISTANCE < distance:
+            return False
+
+        self._checked_positions = (entity.position, item.position)
+        return True
+
 
 class UseItemTask(essentials.Task):
     MAX_DISTANCE = 1.0
@@ -227,12 +254,13 @@ class InventoryUpdateTask(essentials.Task):
         self.hand = hand
         self.inventory_index = inventory_index
         self.update_variant = update_variant
+        self.job = jobs.WaitJob(self.SWAP_DURATION, [events.FinishedEvent(performer_id)])
 
     def start(self, state: state.State) -> Sequence[actions.Action]:
         return list()
 
     def get_job(self) -> Optional[essentials.Job]:
-        return jobs.WaitJob(self.SWAP_DURATION, [events.FinishedEvent(self.performer_id)])
+        return self.job
 
     def finish(self, state: state.State) -> Sequence[actions.Action]:
         performer = state.get_entity(self.performer_id)
@@ -292,6 +320,7 @@ class CraftTask(essentials.Task):
         self._crafter_id = crafter_id
         self._assembly = assembly
         self._job: Optional[essentials.Job] = None
+        self._finish_events: List[events.Event] = [events.FinishedEvent(crafter_id)]
 
     def start(self, state: state.State) -> Sequence[actions.Action]:
         crafter = state.get_entity(self._crafter_id)
@@ -307,7 +336,7 @@ class CraftTask(essentials.Task):
         if not state.validate_assembly(self._assembly, crafter.features.inventory.get()):
             return list()
 
-        self._job = jobs.WaitJob(self.CRAFT_DURATION, [events.FinishedEvent(self._crafter_id)])
+        self._job = jobs.WaitJob(self.CRAFT_DURATION, self._finish_events)
         return [actions.CraftStartAction(self._crafter_id)]
 
     def get_job(self) -> Optional[essentials.Job]:
@@ -318,11 +347,12 @@ class CraftTask(essentials.Task):
         if crafter is None or crafter.features.inventory is None:
             return [actions.CraftEndAction(self._crafter_id)]
 
-        craft_result = state.craft_entity(self._assembly, crafter.features.inventory.get())
+        inventory = crafter.features.inventory.get()
+        craft_result = state.craft_entity(self._assembly, inventory)
         return [
                 actions.CreateActorsAction(craft_result.created),
                 actions.DeleteActorsAction(craft_result.deleted),
-                actions.UpdateInventoryAction(self._crafter_id, crafter.features.inventory.get()),
+                actions.UpdateInventoryAction(self._crafter_id, inventory),
                 actions.CraftEndAction(self._crafter_id),
             ]
 
@@ -19,6 +19,8 @@ class Window(pyglet.window.Window):
         self._controls = controls
         self._animator = animator
 
+        self.push_handlers(controls.key_state)
+
     def run(self) -> None:
         pyglet.app.run()
 
@@ -42,7 +44,6 @@ class Window(pyglet.window.Window):
         self._gui.handle_resize(width, height)
 
     def on_draw(self) -> None:
-        self._controls.handle_draw()
         self._animator.animate()
         self._gui.draw()
         self._schedule_redraw()
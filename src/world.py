@@ -27,6 +27,11 @@ class World:
         self._zoom = 10.0
         self._elevation = 0.0
 
+        # Reused by `move` which is called on every tick while the hero is moving.
+        self._personal_to_global = numpy.empty((4, 4), dtype=numpy.float32)
+        self._directions = numpy.array(((0.0, 0.0, -1.0), (0.0, 0.0, 0.0)))
+        self._headings = numpy.empty((2, 3))
+
         self._ready = False
         self._scene = scene
         self._media = media.Media()
@@ -49,22 +54,27 @@ class World:
 
     def move(self, right_left, front_back) -> None:
         # Calculate current heading
-        transformation = geometry.Matrices3D.personal_to_global(self._theta, self._phi, self._bearing)
-        forward = transformation @ numpy.array((0.0, 0.0, -1.0, 1.0)).reshape(4, 1)
-        toward = transformation @ numpy.array((right_left, 0.0, -front_back, 1.0)).reshape(4, 1)
+        transformation = geometry.Matrices3D.personal_to_global(
+            self._theta, self._phi, self._bearing, out=self._personal_to_global,
+        )
+        self._directions[1, 0] = right_left
+        self._directions[1, 2] = -front_back
+        forward, toward = geometry.Matrices3D.transform_points(
+            transformation, self._directions, out=self._headings,
+        )
 
         # Update `theta` and `phi`
         old = geometry.Coordinates.spherical_to_cartesian(self._radius, self._theta, self._phi)
-        *new, w = numpy.array((*old, 1.0)).reshape(4, 1) + toward
+        new = numpy.array(old) + toward
         r, self._theta, self._phi = geometry.Coordinates.cartesian_to_spherical(*new)
 
         # Update `elevation`
         self._elevation = self._scene.get_elevation(geometry.Point(self._theta, self._phi))
 
         # Update `bearing`
-        new_forward = numpy.array((*new, 1.0)).reshape(4, 1) + forward
+        new_forward = new + forward
         r, lat1, lon1 = geometry.Coordinates.cartesian_to_geographical_radians(*new)
-        r, lat2, lon2 = geometry.Coordinates.cartesian_to_geographical_radians(*new_forward[:3])
+        r, lat2, lon2 = geometry.Coordinates.cartesian_to_geographical_radians(*new_forward)
         coord1 = geometry.Coordinate(lat1, lon1)
         coord2 = geometry.Coordinate(lat2, lon2)
         self._bearing = coord1.bearing_to(coord2)
@@ -246,9 +256,9 @@ class World:
         GL.glUseProgram(0)
 
     def _load_data(self) -> None:
-        def rescale(point: geometry.Point):
+        def rescale(thetas: numpy.ndarray, phis: numpy.ndarray) -> numpy.ndarray:
             assert self._scene.elevation_function is not None
-            return self._scene.elevation_function.evaluate_with_radius(point)
+            return self._scene.elevation_function.evaluate_many_with_radius(thetas, phis)
 
         self._radius = self._scene.get_radius()
         self._elevation = self._scene.get_elevation(geometry.Point(self._theta, self._phi))
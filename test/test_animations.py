@@ -0,0 +1,67 @@
+import unittest
+
+from math import pi
+
+from typing import Any, List, Tuple, cast
+
+from src import actions, animating, animations, defs, geometry, scene
+
+
+class WorldStub:
+    def __init__(self) -> None:
+        self.played: List[Tuple[defs.ActorId, str]] = list()
+
+    def play_animation(self, actor_id: defs.ActorId, animation_name: str) -> None:
+        self.played.append((actor_id, animation_name))
+
+
+class AnimationsTest(unittest.TestCase):
+    def create_context(self, positions: List[geometry.Point]) -> animating.AnimationContext:
+        sc = scene.Scene()
+        sc.configure(0, geometry.ElevationFunction(100.0))
+        sc.create_actors(
+            scene.Actor(defs.ActorId(i), 'pirate', position) for i, position in enumerate(positions)
+        )
+        return animating.AnimationContext(
+            scene=sc,
+            world=cast(Any, WorldStub()),
+            gui=cast(Any, None),
+            sounds=cast(Any, None),
+        )
+
+    def test_movement_tick_many(self) -> None:
+        """Checks if moving actors in a batch gives the same results as moving them one by one."""
+
+        NUM = 2 * animations.MovementAnimation.BATCH_MIN_SIZE
+        INTERVAL = 0.1
+
+        positions = [geometry.Point(0.1 + i * pi / NUM, 0.2 * i) for i in range(NUM)]
+        movement_actions = [
+            actions.MovementAction(defs.ActorId(i), 1.0 + i, -pi + i * 2.0 * pi / NUM, 10.0)
+            for i in range(NUM)
+        ]
+
+        batched_context = self.create_context(positions)
+        batched = [animations.MovementAnimation(action) for action in movement_actions]
+        single_context = self.create_context(positions)
+        single = [animations.MovementAnimation(action) for action in movement_actions]
+
+        for i in range(3):
+            animations.MovementAnimation.tick_many(batched, INTERVAL, batched_context)
+            for animation in single:
+                animation.tick(INTERVAL, single_context)
+
+        for i in range(NUM):
+            expected = single_context.scene.get_actor(defs.ActorId(i)).position
+            computed = batched_context.scene.get_actor(defs.ActorId(i)).position
+            assert expected is not None and computed is not None # for mypy
+            original = positions[i]
+            self.assertNotEqual((computed.theta, computed.phi), (original.theta, original.phi))
+            self.assertAlmostEqual(expected.theta, computed.theta)
+            self.assertAlmostEqual(expected.phi, computed.phi)
+
+        # The walk animation is started only on the first tick
+        for context in (batched_context, single_context):
+            played = cast(WorldStub, context.world).played
+            expected_played = [(defs.ActorId(i), animations.AnimationName.WALK) for i in range(NUM)]
+            self.assertEqual(played, expected_played)
@@ -10,15 +10,8 @@ from . import common
 from src import geometry
 
 class GeometryTest(common.SerdeTest):
-    def assert_tuples_almost_equal(self, t1, t2) -> None:
-        self.assertEqual(len(t1), len(t1))
-        for e1, e2 in zip(t1, t2):
-            self.assertAlmostEqual(e1, e2)
-
     def assert_arrays_almost_equal(self, t1, t2) -> None:
-        self.assertEqual(len(t1), len(t1))
-        for e1, e2 in zip(t1, t2):
-            self.assert_tuples_almost_equal(e1, e2)
+        numpy.testing.assert_allclose(numpy.asarray(t2), numpy.asarray(t1), rtol=0.0, atol=5e-8)
 
     def test_cartesian_to_spherical(self) -> None:
         for cartesian, expected in (
@@ -33,6 +26,19 @@ class GeometryTest(common.SerdeTest):
             computed = geometry.Coordinates.cartesian_to_spherical(*cartesian)
             self.assertEqual(expected, computed)
 
+    def test_cartesian_to_spherical_equator(self) -> None:
+        """Checks if points on the equator are converted correctly for all signs of `x` and `z`."""
+
+        for cartesian, expected in (
+            (( 1.0, 0.0,  0.0), (1.0, 0.50 * pi,  0.50 * pi)),
+            ((-1.0, 0.0,  0.0), (1.0, 0.50 * pi, -0.50 * pi)),
+            (( 0.0, 0.0,  1.0), (1.0, 0.50 * pi,  0.00 * pi)),
+            (( 0.0, 0.0, -1.0), (1.0, 0.50 * pi,  1.00 * pi)),
+            (( 0.0, -1.0, 0.0), (1.0, 1.00 * pi,  0.50 * pi)),
+        ):
+            computed = geometry.Coordinates.cartesian_to_spherical(*cartesian)
+            self.assert_arrays_almost_equal(expected, computed)
+
     def test_spherical_to_cartesian(self) -> None:
         for spherical, expected in (
             ((1.0, 0.0 * pi, 0.0 * pi), (0.0,  1.0,  0.0)),
@@ -43,7 +49,7 @@ class GeometryTest(common.SerdeTest):
             ((1.0, 0.5 * pi, 0.5 * pi), (1.0,  0.0,  0.0)),
         ):
             computed = geometry.Coordinates.spherical_to_cartesian(*spherical)
-            self.assert_tuples_almost_equal(expected, computed)
+            self.assert_arrays_almost_equal(expected, computed)
 
     def test_spherical_to_geographical_degrees(self) -> None:
         for spherical, geographical in (
@@ -54,7 +60,7 @@ class GeometryTest(common.SerdeTest):
             ((1.0, 1.00 * pi, 2.0 * pi), (1.0, -90.0,    0.0)),
         ):
             computed = geometry.Coordinates.spherical_to_geographical_degrees(*spherical)
-            self.assert_tuples_almost_equal(geographical, computed)
+            self.assert_arrays_almost_equal(geographical, computed)
 
     def test_geographical_degrees_spherical(self) -> None:
         for geographical, spherical in (
@@ -65,7 +71,34 @@ class GeometryTest(common.SerdeTest):
             ((1.0, -90.0,    0.0), (1.0, 1.00 * pi, 0.0 * pi)),
         ):
             computed = geometry.Coordinates.geographical_degrees_to_spherical(*geographical)
-            self.assert_tuples_almost_equal(spherical, computed)
+            self.assert_arrays_almost_equal(spherical, computed)
+
+    def test_conversions_of_arrays(self) -> None:
+        """Checks if converting arrays of coordinates gives the same results as scalars."""
+
+        xs = numpy.array((1.0, 0.0, -1.0, 0.0, 0.3, -2.0))
+        ys = numpy.array((0.0, 1.0,  0.0, 0.0, 0.5,  1.5))
+        zs = numpy.array((0.0, 0.0,  0.0, 1.0, -0.2, 0.0))
+
+        computed = geometry.Coordinates.cartesian_to_geographical_degrees(xs, ys, zs)
+        for i, cartesian in enumerate(zip(xs, ys, zs)):
+            expected = geometry.Coordinates.cartesian_to_geographical_degrees(*map(float, cartesian))
+            self.assert_arrays_almost_equal(expected, [values[i] for values in computed])
+
+        spherical = geometry.Coordinates.cartesian_to_spherical(xs, ys, zs)
+        computed = geometry.Coordinates.spherical_to_cartesian(*spherical)
+        self.assert_arrays_almost_equal((xs, ys, zs), computed)
+
+    def test_geographical_radians_wrap(self) -> None:
+        """Checks conversion of longitudes at the boundaries of their ranges."""
+
+        for phi, lon in ((0.0, 0.0), (pi, pi), (1.5 * pi, -0.5 * pi), (2.0 * pi, 0.0)):
+            computed = geometry.Coordinates.spherical_to_geographical_radians(1.0, 0.5 * pi, phi)
+            self.assert_arrays_almost_equal((1.0, 0.0, lon), computed)
+
+        for lon, phi in ((0.0, 0.0), (pi, pi), (-pi, pi), (-0.5 * pi, 1.5 * pi)):
+            computed = geometry.Coordinates.geographical_radians_to_spherical(1.0, 0.0, lon)
+            self.assert_arrays_almost_equal((1.0, 0.5 * pi, phi), computed)
 
     def test_bearing(self) -> None:
         for t1, t2, expected1, expected2 in (
@@ -85,77 +118,122 @@ class GeometryTest(common.SerdeTest):
             self.assertAlmostEqual(expected1, computed1)
             self.assertAlmostEqual(expected2, computed2)
 
+    def test_points_bearings(self) -> None:
+        """Checks if batched bearings are equal to bearings calculated one by one."""
+
+        positions1 = ((0.5 * pi, 0.0), (0.25 * pi, 0.5 * pi), (0.75 * pi, 1.5 * pi), (0.1, 6.2))
+        positions2 = ((0.2 * pi, 1.0), (0.75 * pi, 0.5 * pi), (0.50 * pi, 0.1 * pi), (3.0, 0.1))
+
+        computed = geometry.Points.bearings(
+            numpy.array([theta for theta, phi in positions1]),
+            numpy.array([phi for theta, phi in positions1]),
+            numpy.array([theta for theta, phi in positions2]),
+            numpy.array([phi for theta, phi in positions2]),
+        )
+
+        for i, (position1, position2) in enumerate(zip(positions1, positions2)):
+            expected = geometry.Point(*position1).bearing_to(geometry.Point(*position2))
+            self.assertAlmostEqual(expected, computed[i])
+
+    def test_points_moved_by(self) -> None:
+        """Checks if batched movement gives the same results as moving points one by one."""
+
+        RADIUS = 100.0
+        positions = ((0.5 * pi, 0.0), (0.25 * pi, 0.5 * pi), (0.75 * pi, 1.5 * pi), (0.1, 6.2))
+        distances = (1.0, 5.0, 0.1, 20.0)
+        bearings = (0.0, 0.5 * pi, -0.75 * pi, pi)
+
+        thetas, phis = geometry.Points.moved_by(
+            numpy.array([theta for theta, phi in positions]),
+            numpy.array([phi for theta, phi in positions]),
+            numpy.array(distances),
+            numpy.array(bearings),
+            RADIUS,
+        )
+
+        for i, (position, distance, bearing) in enumerate(zip(positions, distances, bearings)):
+            expected = geometry.Point(*position).moved_by(distance, bearing, RADIUS)
+            self.assertAlmostEqual(expected.theta, thetas[i])
+            self.assertAlmostEqual(expected.phi, phis[i])
+
+    def test_great_circle_distance_to_many(self) -> None:
+        """Checks if batched distances are equal to distances calculated one by one."""
+
+        RADIUS = 100.0
+        reference = geometry.Point(0.5 * pi, 0.1)
+        positions = ((0.5 * pi, 0.0), (0.25 * pi, 0.5 * pi), (0.75 * pi, 1.5 * pi), (0.1, 6.2))
+
+        computed = reference.great_circle_distance_to_many(
+            numpy.array([theta for theta, phi in positions]),
+            numpy.array([phi for theta, phi in positions]),
+            RADIUS,
+        )
+
+        for i, position in enumerate(positions):
+            expected = reference.great_circle_distance_to(geometry.Point(*position), RADIUS)
+            self.assertAlmostEqual(expected, computed[i])
+
+    def test_sphere(self) -> None:
+        """Checks if a subdivided sphere has the expected size and all vertices on its surface."""
+
+        RADIUS = 3.0
+        for n in range(0, 4):
+            sphere = geometry.Structures.sphere(n, RADIUS)
+            vertices = list(sphere.get_vertices())
+            triangles = list(sphere.get_triangles())
+            self.assertEqual(len(vertices), 10 * 4 ** n + 2)
+            self.assertEqual(len(triangles), 20 * 4 ** n)
+            for vertex in vertices:
+                self.assertAlmostEqual(sqrt(sum(v * v for v in vertex)), RADIUS)
+
     def test_personal_to_global(self) -> None:
-        left     = numpy.array((-1.0,  0.0,  0.0, 1.0)).reshape(4, 1)
-        right    = numpy.array(( 1.0,  0.0,  0.0, 1.0)).reshape(4, 1)
-        up       = numpy.array(( 0.0,  1.0,  0.0, 1.0)).reshape(4, 1)
-        down     = numpy.array(( 0.0, -1.0,  0.0, 1.0)).reshape(4, 1)
-        forward  = numpy.array(( 0.0,  0.0, -1.0, 1.0)).reshape(4, 1)
-        backward = numpy.array(( 0.0,  0.0,  1.0, 1.0)).reshape(4, 1)
-
-        transformation = geometry.Matrices3D.personal_to_global(0.0, 0.0, 0.0)
-        self.assert_arrays_almost_equal(transformation @ left, left)
-        self.assert_arrays_almost_equal(transformation @ right, right)
-        self.assert_arrays_almost_equal(transformation @ up, up)
-        self.assert_arrays_almost_equal(transformation @ down, down)
-        self.assert_arrays_almost_equal(transformation @ forward, forward)
-        self.assert_arrays_almost_equal(transformation @ backward, backward)
-
-        transformation = geometry.Matrices3D.personal_to_global(0.5 * pi, 0.0, 0.0)
-        self.assert_arrays_almost_equal(transformation @ left, left)
-        self.assert_arrays_almost_equal(transformation @ right, right)
-        self.assert_arrays_almost_equal(transformation @ up, backward)
-        self.assert_arrays_almost_equal(transformation @ down, forward)
-        self.assert_arrays_almost_equal(transformation @ forward, up)
-        self.assert_arrays_almost_equal(transformation @ backward, down)
-
-        transformation = geometry.Matrices3D.personal_to_global(pi, 0.0, 0.0)
-        self.assert_arrays_almost_equal(transformation @ left, left)
-        self.assert_arrays_almost_equal(transformation @ right, right)
-        self.assert_arrays_almost_equal(transformation @ up, down)
-        self.assert_arrays_almost_equal(transformation @ down, up)
-        self.assert_arrays_almost_equal(transformation @ forward, backward)
-        self.assert_arrays_almost_equal(transformation @ backward, forward)
-
-        transformation = geometry.Matrices3D.personal_to_global(0.5 * pi, 0.5 * pi, 0.0)
-        self.assert_arrays_almost_equal(transformation @ left, backward)
-        self.assert_arrays_almost_equal(transformation @ right, forward)
-        self.assert_arrays_almost_equal(transformation @ up, right)
-        self.assert_arrays_almost_equal(transformation @ down, left)
-        self.assert_arrays_almost_equal(transformation @ forward, up)
-        self.assert_arrays_almost_equal(transformation @ backward, down)
-
-        transformation = geometry.Matrices3D.personal_to_global(0.5 * pi, -0.5 * pi, 0.0)
-        self.assert_arrays_almost_equal(transformation @ left, forward)
-        self.assert_arrays_almost_equal(transformation @ right, backward)
-        self.assert_arrays_almost_equal(transformation @ up, left)
-        self.assert_arrays_almost_equal(transformation @ down, right)
-        self.assert_arrays_almost_equal(transformation @ forward, up)
-        self.assert_arrays_almost_equal(transformation @ backward, down)
-
-        transformation = geometry.Matrices3D.personal_to_global(0.0, 0.0, 0.5 * pi)
-        self.assert_arrays_almost_equal(transformation @ left, forward)
-        self.assert_arrays_almost_equal(transformation @ right, backward)
-        self.assert_arrays_almost_equal(transformation @ up, up)
-        self.assert_arrays_almost_equal(transformation @ down, down)
-        self.assert_arrays_almost_equal(transformation @ forward, right)
-        self.assert_arrays_almost_equal(transformation @ backward, left)
-
-        transformation = geometry.Matrices3D.personal_to_global(0.5 * pi, 1.0 * pi, pi)
-        self.assert_arrays_almost_equal(transformation @ left, left)
-        self.assert_arrays_almost_equal(transformation @ right, right)
-        self.assert_arrays_almost_equal(transformation @ up, forward)
-        self.assert_arrays_almost_equal(transformation @ down, backward)
-        self.assert_arrays_almost_equal(transformation @ forward, down)
-        self.assert_arrays_almost_equal(transformation @ backward, up)
-
-        transformation = geometry.Matrices3D.personal_to_global(0.5 * pi, 0.5 * pi, 0.5 * pi)
-        self.assert_arrays_almost_equal(transformation @ left, up)
-        self.assert_arrays_almost_equal(transformation @ right, down)
-        self.assert_arrays_almost_equal(transformation @ up, right)
-        self.assert_arrays_almost_equal(transformation @ down, left)
-        self.assert_arrays_almost_equal(transformation @ forward, forward)
-        self.assert_arrays_almost_equal(transformation @ backward, backward)
+        left     = (-1.0,  0.0,  0.0, 1.0)
+        right    = ( 1.0,  0.0,  0.0, 1.0)
+        up       = ( 0.0,  1.0,  0.0, 1.0)
+        down     = ( 0.0, -1.0,  0.0, 1.0)
+        forward  = ( 0.0,  0.0, -1.0, 1.0)
+        backward = ( 0.0,  0.0,  1.0, 1.0)
+
+        # All the directions are transformed at once as columns of a single matrix.
+        directions = numpy.array((left, right, up, down, forward, backward)).T
+
+        for angles, expected in (
+            ((0.0, 0.0, 0.0),                (left, right, up, down, forward, backward)),
+            ((0.5 * pi, 0.0, 0.0),           (left, right, backward, forward, up, down)),
+            ((pi, 0.0, 0.0),                 (left, right, down, up, backward, forward)),
+            ((0.5 * pi, 0.5 * pi, 0.0),      (backward, forward, right, left, up, down)),
+            ((0.5 * pi, -0.5 * pi, 0.0),     (forward, backward, left, right, up, down)),
+            ((0.0, 0.0, 0.5 * pi),           (forward, backward, up, down, right, left)),
+            ((0.5 * pi, 1.0 * pi, pi),       (left, right, forward, backward, down, up)),
+            ((0.5 * pi, 0.5 * pi, 0.5 * pi), (up, down, right, left, forward, backward)),
+        ):
+            transformation = geometry.Matrices3D.personal_to_global(*angles)
+            computed = geometry.Matrices3D.transform_batch(transformation, directions)
+            self.assert_arrays_almost_equal(numpy.array(expected).T, computed)
+
+            out = numpy.empty((4, len(expected)))
+            geometry.Matrices3D.transform_batch(transformation, directions, out)
+            self.assert_arrays_almost_equal(numpy.array(expected).T, out)
+
+            points = numpy.empty((len(expected), 3))
+            geometry.Matrices3D.transform_points(transformation, directions.T[:, :3], points)
+            self.assert_arrays_almost_equal(numpy.array(expected)[:, :3], points)
+
+    def test_personal_to_global_expanded(self) -> None:
+        """Checks if the expanded transformation equals the product of the elementary rotations."""
+
+        for theta, phi, bearing in ((0.3, 1.2, -2.1), (2.9, -0.7, 0.4), (1.1, 4.0, 3.3)):
+            expected = numpy.linalg.multi_dot((
+                geometry.Matrices3D.rotation_y(phi),
+                geometry.Matrices3D.rotation_x(theta),
+                geometry.Matrices3D.rotation_y(-bearing),
+            ))
+            computed = geometry.Matrices3D.personal_to_global(theta, phi, bearing)
+            self.assertTrue(numpy.allclose(expected, computed, atol=1e-6))
+
+            out = numpy.full((4, 4), numpy.nan, dtype=numpy.float32)
+            geometry.Matrices3D.personal_to_global(theta, phi, bearing, out=out)
+            self.assertTrue(numpy.array_equal(computed, out))
 
     def test_elevation_function_serialization(self) -> None:
         """Checks if the elevation function is serialized and deserialized properly."""
@@ -179,3 +257,41 @@ class GeometryTest(common.SerdeTest):
 
         self.assert_serde(original, geometry.ElevationFunction.Schema(), geometry.ElevationFunction)
 
+
+    def test_elevation_function_evaluate_many(self) -> None:
+        """Checks if batched elevation is equal to elevation evaluated point by point."""
+
+        elevation_function = geometry.ElevationFunction(100.0)
+        elevation_function.add(geometry.Hills(geometry.Point(0.0, 0.0)))
+        elevation_function.add(geometry.Ranges(geometry.Point(0.0, 0.0)))
+        elevation_function.add(geometry.Continents(geometry.Point(0.0, 0.0)))
+        elevation_function.add(geometry.Hills(geometry.Point(1.0, 2.0)))
+
+        positions = ((0.5 * pi, 0.0), (0.25 * pi, 0.5 * pi), (0.75 * pi, 1.5 * pi), (0.1, 6.2))
+        computed = elevation_function.evaluate_many_with_radius(
+            numpy.array([theta for theta, phi in positions]),
+            numpy.array([phi for theta, phi in positions]),
+        )
+
+        for i, position in enumerate(positions):
+            expected = elevation_function.evaluate_with_radius(geometry.Point(*position))
+            self.assertAlmostEqual(expected, computed[i])
+
+    def test_elevation_function_evaluate_many_same_type(self) -> None:
+        """Checks if batched elevation counts every terrain when several share the same type."""
+
+        elevation_function = geometry.ElevationFunction(100.0)
+        elevation_function.add(geometry.Hills(geometry.Point(0.0, 0.0)))
+        elevation_function.add(geometry.Hills(geometry.Point(0.4, 2.5)))
+        elevation_function.add(geometry.Ranges(geometry.Point(1.0, 1.0)))
+        elevation_function.add(geometry.Ranges(geometry.Point(2.2, 5.1)))
+
+        positions = ((0.3, 0.7), (1.2, 2.9), (2.6, 4.4), (0.5 * pi, 1.5 * pi))
+        computed = elevation_function.evaluate_many_with_radius(
+            numpy.array([theta for theta, phi in positions]),
+            numpy.array([phi for theta, phi in positions]),
+        )
+
+        for i, position in enumerate(positions):
+            expected = elevation_function.evaluate_with_radius(geometry.Point(*position))
+            self.assertAlmostEqual(expected, computed[i])
@@ -55,6 +55,17 @@ class StateTest(unittest.TestCase):
             }
         self.assertEqual(result_items, expected_items)
 
+    def test_craft_results_are_independent(self) -> None:
+        """Checks if separate craft results do not share their lists of actors."""
+
+        first = state.CraftResult()
+        first.add_for_deletion(defs.ActorId(1))
+        second = state.CraftResult()
+
+        self.assertEqual(first.deleted, [1])
+        self.assertEqual(second.deleted, [])
+        self.assertEqual(second.created, [])
+
     def test_merge_entities_fit(self) -> None:
         NUM1, NUM2 = 2, 2
         NUMS = NUM1 + NUM2